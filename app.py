@@ -5,33 +5,63 @@ WSGI-compatible web server for hosting platforms (Heroku, Railway, Render, etc.)
 """
 
 import os
+
+# Cooperative networking for gunicorn's gevent worker (-k gevent). This has to run
+# before anything else imports socket/ssl so requests and gspread get patched too.
+if os.getenv('USE_GEVENT', 'false').lower() == 'true':
+    from gevent import monkey
+    monkey.patch_all()
+
 import sys
 import logging
 import signal
 import atexit
 from flask import Flask, request, jsonify
-from datetime import datetime
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.middleware.proxy_fix import ProxyFix
 import threading
 import time
-
-# Add the parent directory to the Python path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import queue
+import orjson
 
 # Import application modules
+from wallet_bot.config import config
 from wallet_bot.config.settings import (
-    Config, 
     validate_configuration,
     get_verify_token,
     get_page_access_token
 )
 from wallet_bot.messenger.handler import process_webhook_message
+from wallet_bot.sheets import batched_writes, flush_pending_writes
 from wallet_bot.sheets.handler import initialize_sheets, test_sheets_connection
 
 # Global application state
 _app_initialized = False
 _initialization_lock = threading.Lock()
 
+# Cached /health check results: key -> (checked_at, ok, error)
+HEALTH_CACHE_TTL = float(os.getenv('HEALTH_CACHE_TTL', '30'))
+_health_cache = {'cfg': (0.0, None, None), 'db': (0.0, None, None)}
+_health_lock = threading.Lock()
+
+# Last formatted UTC timestamp for the health endpoints: [epoch_second, iso_string]
+_timestamp_cache = [0, '']
+
+# In-process webhook queue so Meta gets its 200 OK without waiting on Sheets/Send API calls
+WEBHOOK_QUEUE_SIZE = int(os.getenv('WEBHOOK_QUEUE_SIZE', '1000'))
+_webhook_queue = queue.Queue(maxsize=WEBHOOK_QUEUE_SIZE)
+_webhook_worker = None
+_webhook_worker_lock = threading.Lock()
+_WORKER_STOP = object()
+
+# Payloads already waiting in the queue are processed together (up to this many),
+# so their Data_Log rows go to Sheets in a single append
+WEBHOOK_BATCH_SIZE = int(os.getenv('WEBHOOK_BATCH_SIZE', '20'))
+
+# Shutdown bookkeeping (handlers are registered at module scope, not per create_app() call)
+_shutdown_handlers_registered = False
+_cleaned_up = False
+
 def setup_logging():
     """
     Configure production-ready logging with different levels for different environments.
@@ -59,18 +89,286 @@ def setup_logging():
 
 logger = setup_logging()
 
+def _utc_timestamp():
+    """
+    Get the current UTC time as an ISO-8601 string, re-formatted at most once per second.
+    """
+    now = time.time()
+    if int(now) != _timestamp_cache[0]:
+        _timestamp_cache[:] = [int(now), time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(now))]
+    return _timestamp_cache[1]
+
+def _cached_check(key, check_fn, ttl=None):
+    """
+    Run a health check at most once per TTL and share the result between probes.
+    
+    A check passes unless it raises or returns False.
+    
+    Returns:
+        tuple: (ok, error) where error is the exception message if the check failed
+    """
+    ttl = HEALTH_CACHE_TTL if ttl is None else ttl
+    
+    checked_at, ok, err = _health_cache[key]
+    if ok is not None and time.monotonic() - checked_at < ttl:
+        return ok, err
+    
+    with _health_lock:
+        # Another probe may have refreshed the result while we were waiting
+        checked_at, ok, err = _health_cache[key]
+        if ok is not None and time.monotonic() - checked_at < ttl:
+            return ok, err
+        
+        try:
+            ok, err = check_fn() is not False, None
+        except Exception as e:
+            ok, err = False, str(e)
+        
+        _health_cache[key] = (time.monotonic(), ok, err)
+        return ok, err
+
+def ensure_initialization():
+    """
+    Thread-safe initialization that only runs once.
+    
+    Returns:
+        bool: True if the application is initialized, False if initialization failed
+    """
+    global _app_initialized
+    
+    if _app_initialized:
+        return True
+        
+    with _initialization_lock:
+        if _app_initialized:
+            return True
+            
+        try:
+            logger.info("🚀 Initializing Messenger Wallet Bot...")
+            
+            # Validate all configuration settings
+            logger.info("📋 Validating configuration...")
+            validate_configuration()
+            logger.info("✅ Configuration validated successfully")
+            
+            # Test Google Sheets connection with retry logic
+            logger.info("📊 Testing Google Sheets connection...")
+            max_retries = 3
+            for attempt in range(max_retries):
+                try:
+                    test_sheets_connection()
+                    logger.info("✅ Google Sheets connection successful")
+                    break
+                except Exception as e:
+                    if attempt == max_retries - 1:
+                        raise
+                    logger.warning(f"Sheets connection attempt {attempt + 1} failed, retrying...")
+                    time.sleep(2 ** attempt)  # Exponential backoff
+            
+            # Initialize sheets with proper headers if needed
+            logger.info("📋 Initializing sheet structure...")
+            initialize_sheets()
+            logger.info("✅ Sheets initialized successfully")
+            
+            _app_initialized = True
+            logger.info("🎉 Application initialization complete!")
+            return True
+            
+        except Exception as e:
+            logger.error(f"❌ Application initialization failed: {str(e)}")
+            # In production, don't fail completely - allow health checks to work
+            if config.is_development():
+                raise
+            return False
+
+def _next_batch():
+    """
+    Wait for the next queued payload, then take whatever else is already waiting.
+    
+    Nothing waits for more payloads to arrive, so a lone message is never delayed.
+    
+    Returns:
+        list: Between 1 and WEBHOOK_BATCH_SIZE queued items
+    """
+    batch = [_webhook_queue.get()]
+    
+    while len(batch) < WEBHOOK_BATCH_SIZE and batch[-1] is not _WORKER_STOP:
+        try:
+            batch.append(_webhook_queue.get_nowait())
+        except queue.Empty:
+            break
+    
+    return batch
+
+def _process_queued_payload(data):
+    """
+    Process a single queued webhook payload, logging instead of raising on failure.
+    """
+    try:
+        # Retry initialization off the request path if it failed at startup
+        if not _app_initialized:
+            ensure_initialization()
+        
+        # Process the webhook message through our conversation handler
+        result = process_webhook_message(data)
+        
+        if result:
+            logger.info("✅ Message processed successfully")
+        else:
+            logger.warning("⚠️ Message processing returned False")
+            
+    except Exception as e:
+        logger.error(f"❌ Error processing webhook message: {str(e)}")
+        logger.error(f"Request data: {data}")
+
+def _drain_loop():
+    """
+    Background worker that processes queued webhook payloads in small batches.
+    
+    Report rebuilds requested while handling a batch are scheduled once when it
+    ends; the transactions themselves go through the Sheets write queue.
+    """
+    while True:
+        batch = _next_batch()
+        stopping = False
+        
+        try:
+            with batched_writes():
+                for data in batch:
+                    if data is _WORKER_STOP:
+                        stopping = True
+                        continue
+                    _process_queued_payload(data)
+        except Exception as e:
+            logger.error(f"❌ Error processing webhook batch: {str(e)}")
+        finally:
+            for _ in batch:
+                _webhook_queue.task_done()
+        
+        if stopping:
+            return
+
+def start_webhook_worker():
+    """
+    Start the webhook worker thread if it isn't already running.
+    
+    Started lazily from the request path so each forked Gunicorn worker gets its own thread.
+    """
+    global _webhook_worker
+    
+    if _webhook_worker is not None and _webhook_worker.is_alive():
+        return
+    
+    with _webhook_worker_lock:
+        if _webhook_worker is not None and _webhook_worker.is_alive():
+            return
+        
+        _webhook_worker = threading.Thread(target=_drain_loop, name='webhook-worker', daemon=True)
+        _webhook_worker.start()
+        logger.info("🧵 Webhook worker thread started")
+
+def stop_webhook_worker(timeout=10.0):
+    """
+    Let the webhook worker finish the payloads already queued, then stop it.
+    """
+    if _webhook_worker is None or not _webhook_worker.is_alive():
+        return
+    
+    try:
+        _webhook_queue.put(_WORKER_STOP, timeout=timeout)
+    except queue.Full:
+        logger.warning("⚠️ Webhook queue still full at shutdown, pending messages may be lost")
+        return
+    
+    _webhook_worker.join(timeout)
+    if _webhook_worker.is_alive():
+        logger.warning("⚠️ Webhook worker did not finish draining before shutdown")
+
+def _running_under_gunicorn():
+    """
+    Check whether we're being served by Gunicorn, which installs its own signal handlers.
+    """
+    return bool(os.getenv('GUNICORN_CMD_ARGS')) or os.getenv('SERVER_SOFTWARE', '').startswith('gunicorn')
+
+def cleanup():
+    """
+    Cleanup function for graceful shutdown. Safe to call more than once.
+    
+    Under Gunicorn this is called from the worker_exit hook in gunicorn.conf.py.
+    """
+    global _cleaned_up
+    
+    if _cleaned_up:
+        return
+    _cleaned_up = True
+    
+    logger.info("🧹 Performing cleanup...")
+    stop_webhook_worker()
+    
+    # Write any transactions the Sheets background writer still has queued
+    try:
+        flush_pending_writes()
+    except Exception as e:
+        logger.error(f"❌ Failed to write queued transactions: {str(e)}")
+
+def signal_handler(signum, frame):
+    """Handle shutdown signals"""
+    logger.info(f"📡 Received signal {signum}, shutting down gracefully...")
+    cleanup()
+    sys.exit(0)
+
+def register_shutdown_handlers():
+    """
+    Register cleanup with atexit and SIGTERM/SIGINT, once per process.
+    
+    Skipped under Gunicorn: its graceful shutdown would race our sys.exit(0) and
+    cut off in-flight requests, so cleanup runs from its worker_exit hook instead.
+    """
+    global _shutdown_handlers_registered
+    
+    if _shutdown_handlers_registered or _running_under_gunicorn():
+        return
+    _shutdown_handlers_registered = True
+    
+    atexit.register(cleanup)
+    signal.signal(signal.SIGTERM, signal_handler)
+    signal.signal(signal.SIGINT, signal_handler)
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson, which is several times faster than the stdlib json.
+    """
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 def create_app():
     """
     Application factory pattern for better testing and deployment.
     """
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    
+    # A random fallback key differs per Gunicorn worker, so anything signed by one
+    # worker can't be verified by another. Only acceptable for local development.
+    secret_key = os.getenv('SECRET_KEY')
+    if not secret_key:
+        if config.is_development():
+            logger.warning("⚠️ SECRET_KEY not set, using a random per-process key for development")
+        else:
+            logger.error("❌ SECRET_KEY is not set! Each worker will use a different random key. "
+                         "Set SECRET_KEY in the environment for production.")
+        secret_key = os.urandom(24)
     
     # Production configurations
     app.config.update({
         'ENV': os.getenv('FLASK_ENV', 'production'),
         'DEBUG': os.getenv('DEBUG', 'false').lower() == 'true',
         'TESTING': False,
-        'SECRET_KEY': os.getenv('SECRET_KEY', os.urandom(24)),
+        'SECRET_KEY': secret_key,
         'JSON_SORT_KEYS': False,
         'JSONIFY_PRETTYPRINT_REGULAR': False,  # Disable in production
     })
@@ -78,61 +376,9 @@ def create_app():
     # Add proxy fix for hosting platforms (handles X-Forwarded headers)
     app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_proto=1, x_host=1, x_prefix=1)
     
-    # Load config
-    config = Config()
+    # The verify token is fixed for the life of the process, so resolve it once
+    verify_token_expected = get_verify_token()
     
-    def ensure_initialization():
-        """
-        Thread-safe initialization that only runs once.
-        """
-        global _app_initialized
-        
-        if _app_initialized:
-            return True
-            
-        with _initialization_lock:
-            if _app_initialized:
-                return True
-                
-            try:
-                logger.info("🚀 Initializing Messenger Wallet Bot...")
-                
-                # Validate all configuration settings
-                logger.info("📋 Validating configuration...")
-                validate_configuration()
-                logger.info("✅ Configuration validated successfully")
-                
-                # Test Google Sheets connection with retry logic
-                logger.info("📊 Testing Google Sheets connection...")
-                max_retries = 3
-                for attempt in range(max_retries):
-                    try:
-                        test_sheets_connection()
-                        logger.info("✅ Google Sheets connection successful")
-                        break
-                    except Exception as e:
-                        if attempt == max_retries - 1:
-                            raise
-                        logger.warning(f"Sheets connection attempt {attempt + 1} failed, retrying...")
-                        time.sleep(2 ** attempt)  # Exponential backoff
-                
-                # Initialize sheets with proper headers if needed
-                logger.info("📋 Initializing sheet structure...")
-                initialize_sheets()
-                logger.info("✅ Sheets initialized successfully")
-                
-                _app_initialized = True
-                logger.info("🎉 Application initialization complete!")
-                return True
-                
-            except Exception as e:
-                logger.error(f"❌ Application initialization failed: {str(e)}")
-                # In production, don't fail completely - allow health checks to work
-                if config.is_development():
-                    raise
-                return False
-
-
     @app.route('/', methods=['GET'])
     def health_check():
         """
@@ -141,7 +387,7 @@ def create_app():
         return jsonify({
             'status': 'healthy',
             'service': 'Messenger Wallet Bot',
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': _utc_timestamp(),
             'version': '1.0.0',
             'environment': app.config['ENV']
         })
@@ -155,7 +401,7 @@ def create_app():
             # Basic checks
             health_status = {
                 'status': 'healthy',
-                'timestamp': datetime.utcnow().isoformat() + 'Z',
+                'timestamp': _utc_timestamp(),
                 'checks': {
                     'initialization': _app_initialized,
                     'database': False,
@@ -163,19 +409,17 @@ def create_app():
                 }
             }
             
-            # Test configuration
-            try:
-                validate_configuration()
-                health_status['checks']['configuration'] = True
-            except Exception as e:
-                logger.warning(f"Configuration check failed: {e}")
+            # Test configuration (cached for HEALTH_CACHE_TTL seconds)
+            ok, err = _cached_check('cfg', validate_configuration)
+            health_status['checks']['configuration'] = ok
+            if not ok:
+                logger.warning(f"Configuration check failed: {err}")
             
-            # Test database connectivity
-            try:
-                test_sheets_connection()
-                health_status['checks']['database'] = True
-            except Exception as e:
-                logger.warning(f"Database check failed: {e}")
+            # Test database connectivity (cached for HEALTH_CACHE_TTL seconds)
+            ok, err = _cached_check('db', test_sheets_connection)
+            health_status['checks']['database'] = ok
+            if not ok:
+                logger.warning(f"Database check failed: {err}")
             
             # Determine overall status
             all_healthy = all(health_status['checks'].values())
@@ -189,7 +433,7 @@ def create_app():
             return jsonify({
                 'status': 'error',
                 'error': str(e),
-                'timestamp': datetime.utcnow().isoformat() + 'Z'
+                'timestamp': _utc_timestamp()
             }), 500
 
     @app.route('/webhook', methods=['GET'])
@@ -206,7 +450,7 @@ def create_app():
             logger.info(f"📥 Webhook verification request received")
             
             # Verify that this is a valid subscription request
-            if mode == 'subscribe' and verify_token == get_verify_token():
+            if mode == 'subscribe' and verify_token == verify_token_expected:
                 logger.info("✅ Webhook verification successful")
                 return challenge, 200
             else:
@@ -223,26 +467,26 @@ def create_app():
         Handle incoming webhook messages from Meta.
         """
         try:
-            # Ensure app is initialized
-            if not _app_initialized:
-                ensure_initialization()
-            
-            # Get the JSON payload from Meta
-            data = request.get_json()
+            # Parse the JSON payload from Meta directly with orjson
+            # (skips Werkzeug's content-type checks and request body caching)
+            raw = request.get_data(cache=False)
+            try:
+                data = orjson.loads(raw) if raw else None
+            except orjson.JSONDecodeError as e:
+                logger.warning(f"❌ Received malformed webhook payload: {str(e)}")
+                return 'Bad Request', 400
             
             if not data:
                 logger.warning("❌ Received empty webhook payload")
                 return 'Bad Request', 400
             
-            logger.info("📥 Processing webhook message")
-            
-            # Process the webhook message through our conversation handler
-            result = process_webhook_message(data)
-            
-            if result:
-                logger.info("✅ Message processed successfully")
-            else:
-                logger.warning("⚠️ Message processing returned False")
+            # Hand the payload to the background worker and acknowledge immediately
+            start_webhook_worker()
+            try:
+                _webhook_queue.put_nowait(data)
+                logger.info("📥 Webhook message queued for processing")
+            except queue.Full:
+                logger.error(f"❌ Webhook queue is full, dropping message: {data}")
             
             return 'OK', 200  # Always return 200 to prevent Meta retries
             
@@ -271,29 +515,16 @@ def create_app():
         logger.error(f"Unhandled exception: {str(e)}", exc_info=True)
         return jsonify({'error': 'Internal server error'}), 500
 
-    with app.app_context():
+    # Initialize eagerly so the first webhook doesn't pay for it
+    # (set SKIP_INIT_AT_IMPORT=true to skip, e.g. for tests)
+    if os.getenv('SKIP_INIT_AT_IMPORT', 'false').lower() != 'true':
         ensure_initialization()
-        
-    # Graceful shutdown handlers
-    def cleanup():
-        """Cleanup function for graceful shutdown"""
-        logger.info("🧹 Performing cleanup...")
-        
-    atexit.register(cleanup)
-    
-    def signal_handler(signum, frame):
-        """Handle shutdown signals"""
-        logger.info(f"📡 Received signal {signum}, shutting down gracefully...")
-        cleanup()
-        sys.exit(0)
-    
-    signal.signal(signal.SIGTERM, signal_handler)
-    signal.signal(signal.SIGINT, signal_handler)
     
     return app
 
 # Create the Flask app instance (required for WSGI servers)
 app = create_app()
+register_shutdown_handlers()
 
 def main():
     """
@@ -301,21 +532,17 @@ def main():
     In production, use a WSGI server like Gunicorn.
     """
     try:
-        config = Config()
-        
         logger.info("=" * 60)
         logger.info("🤖 MESSENGER WALLET BOT - DEVELOPMENT SERVER")
         logger.info("=" * 60)
-        logger.info("⚠️  For production, use: gunicorn wallet_bot.app:app")
+        logger.info("⚠️  For production, use: gunicorn -k gevent -w 2 --worker-connections 1000 app:app")
+        logger.info("   (with USE_GEVENT=true so outbound HTTP is monkey-patched)")
         logger.info("=" * 60)
         
         # Initialize the application
-        from wallet_bot.app import app
-        with app.app_context():
-            ensure_initialization = app.view_functions['webhook_handler'].__globals__['ensure_initialization']
-            if not ensure_initialization():
-                logger.error("❌ Failed to initialize application. Exiting.")
-                sys.exit(1)
+        if not ensure_initialization():
+            logger.error("❌ Failed to initialize application. Exiting.")
+            sys.exit(1)
         
         # Log configuration info
         logger.info(f"🌐 Server starting on {config.HOST}:{config.PORT}")
@@ -0,0 +1,11 @@
+"""
+Gunicorn configuration for the Messenger Wallet Bot.
+
+Gunicorn owns the worker signal handling, so the app's own SIGTERM/SIGINT
+handlers are skipped there and cleanup runs from the worker_exit hook below.
+"""
+
+def worker_exit(server, worker):
+    """Drain the webhook queue before the worker process goes away"""
+    from app import cleanup
+    cleanup()
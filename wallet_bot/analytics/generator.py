@@ -15,17 +15,32 @@ The module is designed to be data-source agnostic - it works with clean Python d
 structures and knows nothing about Google Sheets or Messenger APIs.
 """
 
-import pandas as pd
+from collections import defaultdict
+from itertools import repeat
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Tuple, Union, Iterator
 from wallet_bot.utils.timezone import (
     now_manila,
     get_week_start_manila,
-    get_month_start_manila
+    get_month_start_manila,
+    MANILA_TIMEZONE
 )
 
+# Transaction types as they are written to the sheet, mapped to their normalized form.
+# Looking these up avoids a str()/lower() per transaction on the common path.
+_NORMALIZED_TYPES = {
+    'income': 'income',
+    'expense': 'expense',
+    'Income': 'income',
+    'Expense': 'expense'
+}
 
-def generate_report(transactions: List[Dict[str, Any]], period: str = "This Week") -> str:
+# Transactions as a list of row dicts, or as columns (e.g. DataFrame.to_dict('list'))
+Transactions = Union[List[Dict[str, Any]], Dict[str, List[Any]]]
+
+
+def generate_report(transactions: Transactions, period: str = "This Week") -> str:
     """
     Generate a comprehensive financial report from transaction data.
     
@@ -36,6 +51,8 @@ def generate_report(transactions: List[Dict[str, Any]], period: str = "This Week
                      - 'amount': float or string representing money amount
                      - 'category': category name (for expenses) or source (for income)
                      - 'description': transaction description
+                     or a dict of equal-length columns with the same keys
+                     (as returned by get_transactions_for_period(..., columnar=True))
         period: Time period for the report ("This Week" or "This Month")
     
     Returns:
@@ -44,22 +61,28 @@ def generate_report(transactions: List[Dict[str, Any]], period: str = "This Week
     if not transactions:
         return f"📊 *{period} Financial Summary*\n\nNo transactions found for this period. Start logging your income and expenses to see insights!"
     
-    # Convert to DataFrame for easier analysis
-    df = _prepare_dataframe(transactions, period)
+    # Aggregate everything we need in a single pass over the transactions
+    totals = _aggregate_transactions(transactions, period)
     
-    if df.empty:
+    if totals['transaction_count'] == 0:
         return f"📊 *{period} Financial Summary*\n\nNo transactions found for this period."
     
     # Calculate core metrics
-    income_total = _calculate_total_income(df)
-    expense_total = _calculate_total_expenses(df)
+    income_total = totals['income_total']
+    expense_total = totals['expense_total']
     net_savings = income_total - expense_total
     
     # Generate insights
-    biggest_expense = _find_biggest_expense(df)
-    top_expense_category = _find_top_expense_category(df)
-    income_breakdown = _get_income_breakdown(df)
-    expense_breakdown = _get_expense_breakdown(df)
+    biggest_expense = totals['biggest_expense']
+    top_expense_category = _find_top_expense_category(totals['expense_by_category'])
+    income_breakdown = [
+        {'source': source, 'amount': amount}
+        for source, amount in _sort_breakdown(totals['income_by_source'])
+    ]
+    expense_breakdown = [
+        {'category': category, 'amount': amount}
+        for category, amount in _sort_breakdown(totals['expense_by_category'])
+    ]
     
     # Calculate additional insights
     tithe_recommendation = income_total * 0.10
@@ -77,56 +100,64 @@ def generate_report(transactions: List[Dict[str, Any]], period: str = "This Week
         expense_breakdown=expense_breakdown,
         tithe_recommendation=tithe_recommendation,
         savings_rate=savings_rate,
-        transaction_count=len(df)
+        transaction_count=totals['transaction_count']
     )
     
     return report
 
 
-def _prepare_dataframe(transactions: List[Dict[str, Any]], period: str) -> pd.DataFrame:
+def _aggregate_transactions(transactions: Transactions, period: str) -> Dict[str, Any]:
     """
-    Convert transaction list to filtered pandas DataFrame for the specified period.
+    Filter transactions to the specified period and accumulate every metric the
+    report needs in one linear pass.
     """
-    if not transactions:
-        return pd.DataFrame()
-    
-    # Convert to DataFrame
-    df = pd.DataFrame(transactions)
+    cutoff = _get_period_cutoff(period)
+    
+    income_total = 0.0
+    expense_total = 0.0
+    income_by_source = defaultdict(float)
+    expense_by_category = defaultdict(float)
+    biggest_expense = None
+    transaction_count = 0
+    
+    for raw_timestamp, raw_type, category, raw_amount, description in _iter_fields(transactions):
+        timestamp = _parse_timestamp(raw_timestamp)
+        if timestamp is None or timestamp < cutoff:
+            continue
+        
+        transaction_count += 1
+        transaction_type = _normalize_type(raw_type)
+        amount = _parse_amount(raw_amount)
+        
+        if transaction_type == 'income':
+            income_total += amount
+            income_by_source[category] += amount
+        elif transaction_type == 'expense':
+            expense_total += amount
+            expense_by_category[category] += amount
+            
+            # Track the single largest expense (first one wins on ties)
+            if biggest_expense is None or amount > biggest_expense['amount']:
+                biggest_expense = {
+                    'amount': amount,
+                    'description': description,
+                    'category': category
+                }
     
-    # FIXED: Map actual column names from sheets to expected names
-    # The sheets use 'transaction_type' and 'category_or_source'
-    # but this module expects 'type' and 'category'
-    if 'transaction_type' in df.columns:
-        df['type'] = df['transaction_type']
-    if 'category_or_source' in df.columns:
-        df['category'] = df['category_or_source']
-    
-    # Ensure required columns exist
-    required_columns = ['timestamp', 'type', 'amount', 'category', 'description']
-    for col in required_columns:
-        if col not in df.columns:
-            df[col] = ''
-    
-    # Convert timestamp to datetime if it's not already
-    if 'timestamp' in df.columns:
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-    
-    # Convert amount to float
-    df['amount'] = pd.to_numeric(df['amount'], errors='coerce').fillna(0.0)
-    
-    # Filter by period
-    df = _filter_by_period(df, period)
-    
-    return df
+    return {
+        'income_total': income_total,
+        'expense_total': expense_total,
+        'income_by_source': income_by_source,
+        'expense_by_category': expense_by_category,
+        'biggest_expense': biggest_expense,
+        'transaction_count': transaction_count
+    }
 
 
-def _filter_by_period(df: pd.DataFrame, period: str) -> pd.DataFrame:
+def _get_period_cutoff(period: str) -> datetime:
     """
-    Filter DataFrame to include only transactions from the specified period using Manila timezone.
+    Get the naive Manila-time cutoff for the specified period.
     """
-    if df.empty or 'timestamp' not in df.columns:
-        return df
-    
     # Use Manila timezone for period calculations
     now_manila_time = now_manila()
     
@@ -141,56 +172,89 @@ def _filter_by_period(df: pd.DataFrame, period: str) -> pd.DataFrame:
         cutoff_date = now_manila_time - timedelta(days=7)
     
     # Convert cutoff to naive datetime for comparison (since timestamps from sheets are naive)
-    cutoff_naive = cutoff_date.replace(tzinfo=None) if cutoff_date.tzinfo else cutoff_date
-    
-    # Filter transactions
-    filtered_df = df[df['timestamp'] >= cutoff_naive].copy()
-    return filtered_df
+    return cutoff_date.replace(tzinfo=None)
 
 
-def _calculate_total_income(df: pd.DataFrame) -> float:
-    """Calculate total income from the DataFrame."""
-    income_df = df[df['type'].str.lower() == 'income']
-    return income_df['amount'].sum()
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    """
+    Convert a timestamp value to a naive Manila-time datetime, or None if it can't be parsed.
+    """
+    if isinstance(value, datetime):
+        timestamp = value
+    elif value:
+        try:
+            timestamp = datetime.fromisoformat(str(value))
+        except ValueError:
+            return None
+    else:
+        return None
+    
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(MANILA_TIMEZONE).replace(tzinfo=None)
+    
+    return timestamp
 
 
-def _calculate_total_expenses(df: pd.DataFrame) -> float:
-    """Calculate total expenses from the DataFrame."""
-    expense_df = df[df['type'].str.lower() == 'expense']
-    return expense_df['amount'].sum()
+def _parse_amount(value: Any) -> float:
+    """Convert an amount value to float, treating anything unparseable as zero."""
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
 
 
-def _find_biggest_expense(df: pd.DataFrame) -> Optional[Dict[str, Any]]:
-    """Find the single largest expense transaction."""
-    expense_df = df[df['type'].str.lower() == 'expense']
-    
-    if expense_df.empty:
-        return None
-    
-    biggest_idx = expense_df['amount'].idxmax()
-    biggest = expense_df.loc[biggest_idx]
+def _iter_fields(transactions: Transactions) -> Iterator[Tuple[Any, Any, Any, Any, Any]]:
+    """
+    Iterate over (timestamp, type, category, amount, description) for each transaction.
     
-    return {
-        'amount': biggest['amount'],
-        'description': biggest['description'],
-        'category': biggest['category']
-    }
+    The sheets use 'transaction_type' and 'category_or_source', while callers
+    may also pass 'type' and 'category'; the sheet names take precedence.
+    Columnar input is zipped directly, without building a dict per row.
+    """
+    if isinstance(transactions, dict):
+        row_count = max(map(len, transactions.values()), default=0)
+        return zip(
+            _get_column(transactions, row_count, 'timestamp'),
+            _get_column(transactions, row_count, 'transaction_type', 'type'),
+            _get_column(transactions, row_count, 'category_or_source', 'category'),
+            _get_column(transactions, row_count, 'amount'),
+            _get_column(transactions, row_count, 'description')
+        )
+    
+    return (
+        (
+            tx.get('timestamp'),
+            tx.get('transaction_type', tx.get('type', '')),
+            tx.get('category_or_source', tx.get('category', '')),
+            tx.get('amount'),
+            tx.get('description', '')
+        )
+        for tx in transactions
+    )
+
 
+def _get_column(columns: Dict[str, List[Any]], row_count: int, *names: str):
+    """Get the first of the named columns that exists, or a column of blanks."""
+    for name in names:
+        if name in columns:
+            return columns[name]
+    return repeat('', row_count)
 
-def _find_top_expense_category(df: pd.DataFrame) -> Optional[Dict[str, Any]]:
+
+def _normalize_type(transaction_type: Any) -> str:
+    """Normalize a transaction type to 'income'/'expense' (lowercased as-is otherwise)."""
+    normalized_type = _NORMALIZED_TYPES.get(transaction_type)
+    if normalized_type is None:
+        normalized_type = str(transaction_type).lower()
+    return normalized_type
+
+
+def _find_top_expense_category(expense_by_category: Dict[str, float]) -> Optional[Dict[str, Any]]:
     """Find the expense category with the highest total spending."""
-    expense_df = df[df['type'].str.lower() == 'expense']
-    
-    if expense_df.empty:
+    if not expense_by_category:
         return None
     
-    category_totals = expense_df.groupby('category')['amount'].sum()
-    
-    if category_totals.empty:
-        return None
-    
-    top_category = category_totals.idxmax()
-    top_amount = category_totals.max()
+    top_category, top_amount = max(expense_by_category.items(), key=itemgetter(1))
     
     return {
         'category': top_category,
@@ -198,34 +262,9 @@ def _find_top_expense_category(df: pd.DataFrame) -> Optional[Dict[str, Any]]:
     }
 
 
-def _get_income_breakdown(df: pd.DataFrame) -> List[Dict[str, Any]]:
-    """Get breakdown of income by source."""
-    income_df = df[df['type'].str.lower() == 'income']
-    
-    if income_df.empty:
-        return []
-    
-    breakdown = income_df.groupby('category')['amount'].sum().sort_values(ascending=False)
-    
-    return [
-        {'source': source, 'amount': amount}
-        for source, amount in breakdown.items()
-    ]
-
-
-def _get_expense_breakdown(df: pd.DataFrame) -> List[Dict[str, Any]]:
-    """Get breakdown of expenses by category."""
-    expense_df = df[df['type'].str.lower() == 'expense']
-    
-    if expense_df.empty:
-        return []
-    
-    breakdown = expense_df.groupby('category')['amount'].sum().sort_values(ascending=False)
-    
-    return [
-        {'category': category, 'amount': amount}
-        for category, amount in breakdown.items()
-    ]
+def _sort_breakdown(totals: Dict[str, float]) -> List[Tuple[str, float]]:
+    """Sort a category/source breakdown by amount, largest first."""
+    return sorted(totals.items(), key=itemgetter(1), reverse=True)
 
 
 def _format_currency(amount: float) -> str:
@@ -311,7 +350,22 @@ def _build_formatted_report(
 
 # Additional utility functions for potential future use
 
-def get_spending_trend(transactions: List[Dict[str, Any]], days: int = 30) -> Dict[str, float]:
+def _iter_expenses(transactions: Transactions, cutoff: datetime):
+    """
+    Yield (timestamp, category, amount) for every expense at or after the cutoff.
+    
+    The type check runs before timestamp parsing, so income rows are skipped cheaply.
+    """
+    for raw_timestamp, raw_type, category, raw_amount, _ in _iter_fields(transactions):
+        if _normalize_type(raw_type) != 'expense':
+            continue
+        timestamp = _parse_timestamp(raw_timestamp)
+        if timestamp is None or timestamp < cutoff:
+            continue
+        yield timestamp, category, _parse_amount(raw_amount)
+
+
+def get_spending_trend(transactions: Transactions, days: int = 30) -> Dict[str, float]:
     """
     Calculate daily spending trend over the specified number of days.
     
@@ -321,28 +375,28 @@ def get_spending_trend(transactions: List[Dict[str, Any]], days: int = 30) -> Di
     if not transactions:
         return {'daily_average': 0.0, 'trend_direction': 0, 'trend_strength': 0.0}
     
-    df = pd.DataFrame(transactions)
-    df['timestamp'] = pd.to_datetime(df['timestamp'])
-    df['amount'] = pd.to_numeric(df['amount'], errors='coerce').fillna(0.0)
-    
-    # Filter to expenses only and last N days
+    # Sum expenses per day for the last N days
     cutoff = datetime.now() - timedelta(days=days)
-    expense_df = df[(df['type'].str.lower() == 'expense') & (df['timestamp'] >= cutoff)]
+    expenses_by_day = defaultdict(float)
+    for timestamp, _, amount in _iter_expenses(transactions, cutoff):
+        expenses_by_day[timestamp.date()] += amount
     
-    if expense_df.empty:
+    if not expenses_by_day:
         return {'daily_average': 0.0, 'trend_direction': 0, 'trend_strength': 0.0}
     
-    # Group by date and sum daily expenses
-    daily_expenses = expense_df.groupby(expense_df['timestamp'].dt.date)['amount'].sum()
-    daily_average = daily_expenses.mean()
+    daily_expenses = [expenses_by_day[day] for day in sorted(expenses_by_day)]
+    day_count = len(daily_expenses)
+    total_expenses = sum(daily_expenses)
+    daily_average = total_expenses / day_count
     
     # Simple trend calculation (comparing first and second half)
-    if len(daily_expenses) < 4:
+    if day_count < 4:
         return {'daily_average': daily_average, 'trend_direction': 0, 'trend_strength': 0.0}
     
-    mid_point = len(daily_expenses) // 2
-    first_half_avg = daily_expenses.iloc[:mid_point].mean()
-    second_half_avg = daily_expenses.iloc[mid_point:].mean()
+    mid_point = day_count // 2
+    first_half_total = sum(daily_expenses[:mid_point])
+    first_half_avg = first_half_total / mid_point
+    second_half_avg = (total_expenses - first_half_total) / (day_count - mid_point)
     
     trend_direction = 1 if second_half_avg > first_half_avg else -1 if second_half_avg < first_half_avg else 0
     trend_strength = abs(second_half_avg - first_half_avg) / first_half_avg if first_half_avg > 0 else 0.0
@@ -354,7 +408,7 @@ def get_spending_trend(transactions: List[Dict[str, Any]], days: int = 30) -> Di
     }
 
 
-def calculate_budget_recommendations(transactions: List[Dict[str, Any]]) -> Dict[str, float]:
+def calculate_budget_recommendations(transactions: Transactions) -> Dict[str, float]:
     """
     Generate budget recommendations based on historical spending patterns.
     
@@ -364,21 +418,14 @@ def calculate_budget_recommendations(transactions: List[Dict[str, Any]]) -> Dict
     if not transactions:
         return {}
     
-    df = pd.DataFrame(transactions)
-    df['amount'] = pd.to_numeric(df['amount'], errors='coerce').fillna(0.0)
-    
     # Focus on last 90 days of expenses
     cutoff = datetime.now() - timedelta(days=90)
-    df['timestamp'] = pd.to_datetime(df['timestamp'])
-    expense_df = df[(df['type'].str.lower() == 'expense') & (df['timestamp'] >= cutoff)]
-    
-    if expense_df.empty:
-        return {}
+    spending_by_category = defaultdict(float)
+    for _, category, amount in _iter_expenses(transactions, cutoff):
+        spending_by_category[category] += amount
     
-    # Calculate monthly average spending per category
-    monthly_spending = expense_df.groupby('category')['amount'].sum() / 3  # 3 months
-    
-    # Add 10% buffer for budgeting
-    budget_recommendations = (monthly_spending * 1.1).round(2).to_dict()
-    
-    return budget_recommendations
\ No newline at end of file
+    # Monthly average spending per category (3 months) plus a 10% buffer for budgeting
+    return {
+        category: round(total / 3 * 1.1, 2)
+        for category, total in spending_by_category.items()
+    }
@@ -6,4 +6,4 @@
 # Instead of: from wallet_bot.config.settings import config
 # You can use: from wallet_bot.config import config
 
-from .settings import config
\ No newline at end of file
+from .settings import config, get_config
\ No newline at end of file
@@ -6,14 +6,32 @@ and providing access to configuration values throughout the application.
 """
 
 import os
+import functools
 from pathlib import Path
-from dotenv import load_dotenv
 
 # Get the project root directory (two levels up from this file)
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 
-# Load environment variables from .env file
-load_dotenv(PROJECT_ROOT / '.env')
+# String forms of the paths above, for cheap os.path checks
+_PROJECT_ROOT_STR = str(PROJECT_ROOT)
+_CREDENTIALS_PATH_STR = os.path.join(_PROJECT_ROOT_STR, 'wallet_bot', 'config', 'credentials.json')
+
+# Common deployment locations for credentials.json (checked after the project root and cwd)
+_DEPLOYMENT_CREDENTIALS_PATHS = (
+    '/opt/render/project/credentials.json',
+    '/opt/render/project/src/credentials.json',
+    './credentials.json',
+    'credentials.json'
+)
+
+# Load environment variables from .env file. On Render they're already in the
+# environment, so skip importing dotenv and parsing the file there.
+if os.getenv('RENDER') != 'true' and os.getenv('RENDER_SERVICE_ID') is None:
+    from dotenv import load_dotenv
+    load_dotenv(PROJECT_ROOT / '.env')
+
+# Environment variables that must be set for the bot to run
+_REQUIRED_SETTING_NAMES = ('PAGE_ACCESS_TOKEN', 'VERIFY_TOKEN', 'GOOGLE_SHEET_ID')
 
 class Config:
     """Configuration class that holds all application settings."""
@@ -28,7 +46,7 @@ class Config:
     # Google Service Account Credentials (Render-compatible)
     # Try JSON string first (for Render environment variable), then file path
     GOOGLE_CREDENTIALS_JSON = os.getenv('GOOGLE_CREDENTIALS_JSON')
-    CREDENTIALS_PATH = PROJECT_ROOT / 'wallet_bot' / 'config' / 'credentials.json'
+    CREDENTIALS_PATH = Path(_CREDENTIALS_PATH_STR)
     
     # Sheet Names
     DATA_LOG_SHEET = 'Data_Log'
@@ -55,6 +73,10 @@ class Config:
     # Environment Detection
     ENVIRONMENT = os.getenv('ENVIRONMENT', 'production' if IS_RENDER else 'development')
     
+    # The environment can't change while the process runs, so decide it once
+    _IS_PRODUCTION = ENVIRONMENT == 'production' or IS_RENDER
+    _IS_DEVELOPMENT = ENVIRONMENT == 'development' and not IS_RENDER
+    
     @classmethod
     def validate_required_settings(cls):
         """
@@ -63,16 +85,7 @@ class Config:
         Raises:
             ValueError: If any required configuration is missing.
         """
-        required_settings = [
-            ('PAGE_ACCESS_TOKEN', cls.PAGE_ACCESS_TOKEN),
-            ('VERIFY_TOKEN', cls.VERIFY_TOKEN),
-            ('GOOGLE_SHEET_ID', cls.GOOGLE_SHEET_ID),
-        ]
-        
-        missing_settings = []
-        for setting_name, setting_value in required_settings:
-            if not setting_value:
-                missing_settings.append(setting_name)
+        missing_settings = [name for name in _REQUIRED_SETTING_NAMES if not getattr(cls, name)]
         
         if missing_settings:
             raise ValueError(
@@ -81,41 +94,34 @@ class Config:
             )
         
         # Check credentials - support both file and JSON string (for Render)
-        if not cls.GOOGLE_CREDENTIALS_JSON and not cls.CREDENTIALS_PATH.exists():
+        if not cls.GOOGLE_CREDENTIALS_JSON and not os.path.exists(_CREDENTIALS_PATH_STR):
             raise FileNotFoundError(
                 f"Google Service Account credentials not found. Either set GOOGLE_CREDENTIALS_JSON "
                 f"environment variable or ensure credentials.json exists at: {cls.CREDENTIALS_PATH}"
             )
     
-    @classmethod
-    def get_credentials_path(self):
-        """Find credentials.json using multiple strategies"""
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def get_credentials_path():
+        """
+        Find credentials.json using multiple strategies.
         
-        # Strategy 1: Relative to current file
-        current_dir = os.path.dirname(__file__)
-        project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
-        path1 = os.path.join(project_root, 'credentials.json')
+        The result is cached, since the file doesn't move while the app is running.
+        """
+        # Strategy 1: Project root
+        path1 = os.path.join(_PROJECT_ROOT_STR, 'credentials.json')
         
         # Strategy 2: Current working directory
         path2 = os.path.join(os.getcwd(), 'credentials.json')
         
         # Strategy 3: Common deployment paths
-        deployment_paths = [
-            '/opt/render/project/credentials.json',
-            '/opt/render/project/src/credentials.json',
-            './credentials.json',
-            'credentials.json'
-        ]
-        
-        # Try all paths
-        all_paths = [path1, path2] + deployment_paths
-        
-        for path in all_paths:
+        for path in (path1, path2) + _DEPLOYMENT_CREDENTIALS_PATHS:
             if os.path.exists(path):
                 return path
         
         # If none found, return the original calculated path for error reporting
         return path1
+    
     @classmethod
     def is_production(cls):
         """
@@ -124,7 +130,7 @@ class Config:
         Returns:
             bool: True if in production (Render), False otherwise.
         """
-        return cls.ENVIRONMENT == 'production' or cls.IS_RENDER
+        return cls._IS_PRODUCTION
     
     @classmethod
     def is_development(cls):
@@ -134,48 +140,66 @@ class Config:
         Returns:
             bool: True if in development mode, False otherwise.
         """
-        return cls.ENVIRONMENT == 'development' and not cls.IS_RENDER
+        return cls._IS_DEVELOPMENT
+
+
+def get_config():
+    """
+    Get the application configuration.
+    
+    All settings live on the Config class itself, so the class is returned
+    rather than an instance.
+    
+    Returns:
+        type[Config]: The configuration class.
+    """
+    return Config
 
+# All state lives on the class, so "config" is just another name for it
+config = Config
 
-# Create a global config instance for easy importing
-config = Config()
+# Frequently used settings as plain module constants, read once at import
+PAGE_ACCESS_TOKEN = Config.PAGE_ACCESS_TOKEN
+VERIFY_TOKEN = Config.VERIFY_TOKEN
+GOOGLE_SHEET_ID = Config.GOOGLE_SHEET_ID
+LOG_LEVEL = Config.LOG_LEVEL
 
 # Convenience functions for commonly accessed settings
 def get_page_access_token():
     """Get the Facebook Page Access Token."""
-    return config.PAGE_ACCESS_TOKEN
+    return PAGE_ACCESS_TOKEN
 
 def get_verify_token():
     """Get the webhook verification token."""
-    return config.VERIFY_TOKEN
+    return VERIFY_TOKEN
 
 def get_google_sheet_id():
     """Get the Google Sheet ID."""
-    return config.GOOGLE_SHEET_ID
+    return GOOGLE_SHEET_ID
 
 def get_credentials_data():
     """Get Google Service Account credentials (JSON object or file path)."""
-    return config.get_credentials_data()
+    return Config.get_credentials_data()
 
 def get_data_log_sheet_name():
     """Get the name of the data log sheet."""
-    return config.DATA_LOG_SHEET
+    return Config.DATA_LOG_SHEET
 
 def is_render_environment():
     """Check if running on Render hosting platform."""
-    return config.IS_RENDER
+    return Config.IS_RENDER
 
 def is_production():
     """Check if running in production mode."""
-    return config.is_production()
+    return Config.is_production()
 
 def get_log_level():
     """Get the logging level."""
-    return config.LOG_LEVEL
+    return LOG_LEVEL
 
 def get_formatted_report_sheet_name():
     """Get the name of the formatted report sheet."""
-    return config.FORMATTED_REPORT_SHEET
+    return Config.FORMATTED_REPORT_SHEET
 
 def validate_configuration():
     """
@@ -188,12 +212,17 @@ def validate_configuration():
         ValueError: If configuration validation fails.
         FileNotFoundError: If required files are missing.
     """
-    config.validate_required_settings()
+    Config.validate_required_settings()
 
 # Export commonly used settings
-__all__ = [
+__all__ = (
     'config',
     'Config',
+    'get_config',
+    'PAGE_ACCESS_TOKEN',
+    'VERIFY_TOKEN',
+    'GOOGLE_SHEET_ID',
+    'LOG_LEVEL',
     'get_page_access_token',
     'get_verify_token',
     'get_google_sheet_id',
@@ -204,4 +233,4 @@ __all__ = [
     'is_production',
     'get_log_level',
     'validate_configuration'
-]
\ No newline at end of file
+)
\ No newline at end of file
@@ -7,10 +7,14 @@ to users through Facebook Messenger.
 """
 
 import requests
-import json
 import logging
+import orjson
+import threading
+from urllib.parse import quote
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
-from wallet_bot.config.settings import get_page_access_token
+from wallet_bot.config.settings import PAGE_ACCESS_TOKEN
+from wallet_bot.utils.http import get_http_session
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -18,6 +22,66 @@ logger = logging.getLogger(__name__)
 # Meta Messenger API endpoints
 MESSENGER_API_URL = "https://graph.facebook.com/v18.0/me/messages"
 
+# Send API request parts, built once at import
+_SEND_HEADERS = {"Content-Type": "application/json"}
+_ACCESS_TOKEN_QUERY = f"access_token={quote(PAGE_ACCESS_TOKEN or '', safe='')}"
+_POST_URL = f"{MESSENGER_API_URL}?{_ACCESS_TOKEN_QUERY}"
+
+# User-facing error messages by error type
+_ERROR_MESSAGES = {
+    "general": (
+        "😅 Oops! Something went wrong. Please try again.\n\n"
+        "If the problem persists, try restarting our conversation."
+    ),
+    "invalid_amount": (
+        "❌ Please enter a valid amount (numbers only).\n\n"
+        "Example: 150 or 1500.50"
+    ),
+    "missing_description": (
+        "❌ Please provide a description for this transaction.\n\n"
+        "Example: 'Lunch at restaurant' or 'Freelance payment'"
+    ),
+    "sheets_error": (
+        "📊 Unable to save to your financial log right now. "
+        "Please try again in a moment.\n\n"
+        "Your data is important to us!"
+    )
+}
+
+WELCOME_TEXT = (
+    "👋 Welcome to Messenger Wallet Bot! 💰\n\n"
+    "I'll help you track your income and expenses effortlessly. "
+    "Just chat with me like you would with a friend!\n\n"
+    "What would you like to do?"
+)
+
+# Main menu options, shared by every call instead of rebuilt each time
+_MAIN_MENU_REPLIES = (
+    {"title": "💸 Log Expense", "payload": "LOG_EXPENSE"},
+    {"title": "💰 Log Income", "payload": "LOG_INCOME"},
+    {"title": "📊 View Statistics", "payload": "VIEW_STATS"}
+)
+
+_CONFIRMATION_REPLIES = (
+    {"title": "💸 Log Another Expense", "payload": "LOG_EXPENSE"},
+    {"title": "💰 Log Income", "payload": "LOG_INCOME"},
+    {"title": "📊 View Statistics", "payload": "VIEW_STATS"}
+)
+
+# The welcome message never changes, so its JSON is encoded once at import
+_WELCOME_MESSAGE_JSON = orjson.dumps({
+    "text": WELCOME_TEXT,
+    "quick_replies": [
+        {"content_type": "text", "title": reply["title"], "payload": reply["payload"]}
+        for reply in _MAIN_MENU_REPLIES
+    ]
+})
+
+# Thread pool for sending several messages concurrently over the pooled session
+SEND_MAX_WORKERS = 20
+_send_executor = None
+_send_executor_lock = threading.Lock()
+
 
 def send_text_message(user_id: str, text: str) -> bool:
     """
@@ -30,17 +94,12 @@ def send_text_message(user_id: str, text: str) -> bool:
     Returns:
         bool: True if message sent successfully, False otherwise
     """
-    try:
-        payload = {
-            "recipient": {"id": user_id},
-            "message": {"text": text}
-        }
-        
-        return _send_message(payload)
-        
-    except Exception as e:
-        logger.error(f"Error sending text message to {user_id}: {str(e)}")
-        return False
+    payload = {
+        "recipient": {"id": user_id},
+        "message": {"text": text}
+    }
+    
+    return _send_message(payload)
 
 
 def send_quick_replies(user_id: str, text: str, replies: List[Dict[str, str]]) -> bool:
@@ -63,29 +122,25 @@ def send_quick_replies(user_id: str, text: str, replies: List[Dict[str, str]]) -
     Returns:
         bool: True if message sent successfully, False otherwise
     """
-    try:
-        # Format quick replies for Meta API
-        quick_replies = []
-        for reply in replies:
-            quick_replies.append({
-                "content_type": "text",
-                "title": reply["title"],
-                "payload": reply["payload"]
-            })
-        
-        payload = {
-            "recipient": {"id": user_id},
-            "message": {
-                "text": text,
-                "quick_replies": quick_replies
-            }
-        }
-        
-        return _send_message(payload)
-        
-    except Exception as e:
-        logger.error(f"Error sending quick replies to {user_id}: {str(e)}")
+    if not _has_title_and_payload(replies):
+        logger.error("Invalid quick replies for %s: each needs a 'title' and 'payload'", user_id)
         return False
+    
+    # Format quick replies for Meta API
+    quick_replies = [
+        {"content_type": "text", "title": reply["title"], "payload": reply["payload"]}
+        for reply in replies
+    ]
+    
+    payload = {
+        "recipient": {"id": user_id},
+        "message": {
+            "text": text,
+            "quick_replies": quick_replies
+        }
+    }
+    
+    return _send_message(payload)
 
 
 def send_typing_indicator(user_id: str, action: str = "typing_on") -> bool:
@@ -99,17 +154,12 @@ def send_typing_indicator(user_id: str, action: str = "typing_on") -> bool:
     Returns:
         bool: True if indicator sent successfully, False otherwise
     """
-    try:
-        payload = {
-            "recipient": {"id": user_id},
-            "sender_action": action
-        }
-        
-        return _send_message(payload)
-        
-    except Exception as e:
-        logger.error(f"Error sending typing indicator to {user_id}: {str(e)}")
-        return False
+    payload = {
+        "recipient": {"id": user_id},
+        "sender_action": action
+    }
+    
+    return _send_message(payload)
 
 
 def send_button_message(user_id: str, text: str, buttons: List[Dict[str, str]]) -> bool:
@@ -131,35 +181,31 @@ def send_button_message(user_id: str, text: str, buttons: List[Dict[str, str]])
     Returns:
         bool: True if message sent successfully, False otherwise
     """
-    try:
-        # Format buttons for Meta API
-        formatted_buttons = []
-        for button in buttons:
-            formatted_buttons.append({
-                "type": button.get("type", "postback"),
-                "title": button["title"],
-                "payload": button["payload"]
-            })
-        
-        payload = {
-            "recipient": {"id": user_id},
-            "message": {
-                "attachment": {
-                    "type": "template",
-                    "payload": {
-                        "template_type": "button",
-                        "text": text,
-                        "buttons": formatted_buttons
-                    }
+    if not _has_title_and_payload(buttons):
+        logger.error("Invalid buttons for %s: each needs a 'title' and 'payload'", user_id)
+        return False
+    
+    # Format buttons for Meta API
+    formatted_buttons = [
+        {"type": button.get("type", "postback"), "title": button["title"], "payload": button["payload"]}
+        for button in buttons
+    ]
+    
+    payload = {
+        "recipient": {"id": user_id},
+        "message": {
+            "attachment": {
+                "type": "template",
+                "payload": {
+                    "template_type": "button",
+                    "text": text,
+                    "buttons": formatted_buttons
                 }
             }
         }
-        
-        return _send_message(payload)
-        
-    except Exception as e:
-        logger.error(f"Error sending button message to {user_id}: {str(e)}")
-        return False
+    }
+    
+    return _send_message(payload)
 
 
 def send_generic_template(user_id: str, elements: List[Dict[str, Any]]) -> bool:
@@ -174,25 +220,20 @@ def send_generic_template(user_id: str, elements: List[Dict[str, Any]]) -> bool:
     Returns:
         bool: True if message sent successfully, False otherwise
     """
-    try:
-        payload = {
-            "recipient": {"id": user_id},
-            "message": {
-                "attachment": {
-                    "type": "template",
-                    "payload": {
-                        "template_type": "generic",
-                        "elements": elements
-                    }
+    payload = {
+        "recipient": {"id": user_id},
+        "message": {
+            "attachment": {
+                "type": "template",
+                "payload": {
+                    "template_type": "generic",
+                    "elements": elements
                 }
             }
         }
-        
-        return _send_message(payload)
-        
-    except Exception as e:
-        logger.error(f"Error sending generic template to {user_id}: {str(e)}")
-        return False
+    }
+    
+    return _send_message(payload)
 
 
 def send_welcome_message(user_id: str) -> bool:
@@ -205,20 +246,14 @@ def send_welcome_message(user_id: str) -> bool:
     Returns:
         bool: True if message sent successfully, False otherwise
     """
-    welcome_text = (
-        "👋 Welcome to Messenger Wallet Bot! 💰\n\n"
-        "I'll help you track your income and expenses effortlessly. "
-        "Just chat with me like you would with a friend!\n\n"
-        "What would you like to do?"
-    )
-    
-    quick_replies = [
-        {"title": "💸 Log Expense", "payload": "LOG_EXPENSE"},
-        {"title": "💰 Log Income", "payload": "LOG_INCOME"},
-        {"title": "📊 View Statistics", "payload": "VIEW_STATS"}
-    ]
-    
-    return send_quick_replies(user_id, welcome_text, quick_replies)
+    try:
+        # Only the recipient changes, so splice it into the pre-serialized message
+        body = b'{"recipient":{"id":' + orjson.dumps(user_id) + b'},"message":' + _WELCOME_MESSAGE_JSON + b'}'
+        return _post_message(body, user_id)
+        
+    except orjson.JSONEncodeError as e:
+        logger.error(f"Error sending welcome message to {user_id}: {str(e)}")
+        return False
 
 
 def send_confirmation_message(user_id: str, transaction_type: str, amount: float, 
@@ -248,27 +283,21 @@ def send_confirmation_message(user_id: str, transaction_type: str, amount: float
             action = "logged"
         
         # Build confirmation message
-        confirmation_text = f"{emoji} Successfully {action}!\n\n"
-        confirmation_text += f"Amount: {formatted_amount}\n"
+        parts = [f"{emoji} Successfully {action}!", "", f"Amount: {formatted_amount}"]
         
         if category:
-            confirmation_text += f"Category: {category}\n"
+            parts.append(f"Category: {category}")
         
         if description:
-            confirmation_text += f"Description: {description}\n"
+            parts.append(f"Description: {description}")
         
-        confirmation_text += "\nWhat would you like to do next?"
+        parts.extend(("", "What would you like to do next?"))
+        confirmation_text = "\n".join(parts)
         
         # Offer main menu options again
-        quick_replies = [
-            {"title": "💸 Log Another Expense", "payload": "LOG_EXPENSE"},
-            {"title": "💰 Log Income", "payload": "LOG_INCOME"},
-            {"title": "📊 View Statistics", "payload": "VIEW_STATS"}
-        ]
+        return send_quick_replies(user_id, confirmation_text, _CONFIRMATION_REPLIES)
         
-        return send_quick_replies(user_id, confirmation_text, quick_replies)
-        
-    except Exception as e:
+    except (AttributeError, TypeError, ValueError) as e:
         logger.error(f"Error sending confirmation message to {user_id}: {str(e)}")
         return False
 
@@ -284,30 +313,18 @@ def send_error_message(user_id: str, error_type: str = "general") -> bool:
     Returns:
         bool: True if message sent successfully, False otherwise
     """
-    error_messages = {
-        "general": (
-            "😅 Oops! Something went wrong. Please try again.\n\n"
-            "If the problem persists, try restarting our conversation."
-        ),
-        "invalid_amount": (
-            "❌ Please enter a valid amount (numbers only).\n\n"
-            "Example: 150 or 1500.50"
-        ),
-        "missing_description": (
-            "❌ Please provide a description for this transaction.\n\n"
-            "Example: 'Lunch at restaurant' or 'Freelance payment'"
-        ),
-        "sheets_error": (
-            "📊 Unable to save to your financial log right now. "
-            "Please try again in a moment.\n\n"
-            "Your data is important to us!"
-        )
-    }
-    
-    message = error_messages.get(error_type, error_messages["general"])
+    message = _ERROR_MESSAGES.get(error_type, _ERROR_MESSAGES["general"])
     return send_text_message(user_id, message)
 
 
+def _has_title_and_payload(options: List[Dict[str, str]]) -> bool:
+    """Check that every quick reply or button has a title and a payload."""
+    return all(
+        option.get("title") is not None and option.get("payload") is not None
+        for option in options
+    )
+
+
 def _send_message(payload: Dict[str, Any]) -> bool:
     """
     Internal helper function to send messages to Meta API.
@@ -319,47 +336,124 @@ def _send_message(payload: Dict[str, Any]) -> bool:
         bool: True if message sent successfully, False otherwise
     """
     try:
-        # Get access token
-        access_token = get_page_access_token()
-        
-        # Prepare headers
-        headers = {
-            "Content-Type": "application/json"
-        }
-        
-        # Prepare parameters
-        params = {
-            "access_token": access_token
-        }
+        body = orjson.dumps(payload)
+    except orjson.JSONEncodeError as e:
+        logger.error("Could not encode message payload: %s", e)
+        return False
+    
+    return _post_message(body, payload['recipient']['id'])
+
+
+def _post_message(body: bytes, recipient_id: str) -> bool:
+    """
+    Post an already-serialized JSON message body to Meta API.
+    
+    Args:
+        body (bytes): The JSON-encoded message payload
+        recipient_id (str): The recipient's Facebook user ID, for logging
         
-        # Send request to Meta API
-        response = requests.post(
-            MESSENGER_API_URL,
-            params=params,
-            headers=headers,
-            json=payload,
+    Returns:
+        bool: True if message sent successfully, False otherwise
+    """
+    try:
+        # Send request to Meta API over the shared keep-alive session
+        response = get_http_session().post(
+            _POST_URL,
+            headers=_SEND_HEADERS,
+            data=body,
             timeout=10
         )
         
-        # Check if request was successful
+        # Check if request was successful (log arguments are only formatted if the record is emitted)
         if response.status_code == 200:
-            logger.info(f"Message sent successfully to user {payload['recipient']['id']}")
+            logger.info("Message sent successfully to user %s", recipient_id)
             return True
         else:
-            logger.error(f"Failed to send message. Status: {response.status_code}, Response: {response.text}")
+            logger.error("Failed to send message. Status: %s, Response: %s", response.status_code, response.text)
             return False
             
     except requests.exceptions.Timeout:
         logger.error("Request to Meta API timed out")
         return False
     except requests.exceptions.RequestException as e:
-        logger.error(f"Request error when sending message: {str(e)}")
-        return False
-    except Exception as e:
-        logger.error(f"Unexpected error in _send_message: {str(e)}")
+        logger.error("Request error when sending message: %s", e)
         return False
 
 
+def _get_send_executor() -> ThreadPoolExecutor:
+    """Get the shared send thread pool, creating it on first use."""
+    global _send_executor
+    
+    if _send_executor is None:
+        with _send_executor_lock:
+            if _send_executor is None:
+                _send_executor = ThreadPoolExecutor(
+                    max_workers=SEND_MAX_WORKERS,
+                    thread_name_prefix='messenger-send'
+                )
+    return _send_executor
+
+
+def _send_message_async(payload: Dict[str, Any]) -> "Future[bool]":
+    """
+    Send a message to Meta API without blocking the caller.
+    
+    Args:
+        payload (Dict): The message payload to send
+        
+    Returns:
+        Future[bool]: Resolves to True if the message was sent successfully
+    """
+    return _get_send_executor().submit(_send_message, payload)
+
+
+def send_text_message_async(user_id: str, text: str) -> "Future[bool]":
+    """
+    Send a plain text message to a user without waiting for the response.
+    
+    Several sends can be started and then awaited together, e.g. with
+    concurrent.futures.wait(), so N messages cost about one round trip.
+    
+    Args:
+        user_id (str): The recipient's Facebook user ID
+        text (str): The message text to send
+        
+    Returns:
+        Future[bool]: Resolves to the result of send_text_message()
+    """
+    return _get_send_executor().submit(send_text_message, user_id, text)
+
+
+def send_typing_indicator_async(user_id: str, action: str = "typing_on") -> "Future[bool]":
+    """
+    Send a typing indicator without waiting for the response, so the reply can
+    be prepared (and sent) while the indicator request is still in flight.
+    
+    Args:
+        user_id (str): The recipient's Facebook user ID
+        action (str): Either "typing_on" or "typing_off"
+        
+    Returns:
+        Future[bool]: Resolves to the result of send_typing_indicator()
+    """
+    return _get_send_executor().submit(send_typing_indicator, user_id, action)
+
+
+def send_quick_replies_async(user_id: str, text: str, replies: List[Dict[str, str]]) -> "Future[bool]":
+    """
+    Send a message with quick reply buttons without waiting for the response.
+    
+    Args:
+        user_id (str): The recipient's Facebook user ID
+        text (str): The message text to display above the buttons
+        replies (List[Dict]): List of quick reply options (see send_quick_replies)
+        
+    Returns:
+        Future[bool]: Resolves to the result of send_quick_replies()
+    """
+    return _get_send_executor().submit(send_quick_replies, user_id, text, replies)
+
+
 def get_user_profile(user_id: str) -> Optional[Dict[str, Any]]:
     """
     Get user profile information from Meta API.
@@ -371,15 +465,9 @@ def get_user_profile(user_id: str) -> Optional[Dict[str, Any]]:
         Dict or None: User profile data if successful, None otherwise
     """
     try:
-        access_token = get_page_access_token()
+        url = f"https://graph.facebook.com/v18.0/{user_id}?fields=first_name,last_name,profile_pic&{_ACCESS_TOKEN_QUERY}"
         
-        url = f"https://graph.facebook.com/v18.0/{user_id}"
-        params = {
-            "fields": "first_name,last_name,profile_pic",
-            "access_token": access_token
-        }
-        
-        response = requests.get(url, params=params, timeout=10)
+        response = get_http_session().get(url, timeout=10)
         
         if response.status_code == 200:
             return response.json()
@@ -387,7 +475,7 @@ def get_user_profile(user_id: str) -> Optional[Dict[str, Any]]:
             logger.error(f"Failed to get user profile. Status: {response.status_code}")
             return None
             
-    except Exception as e:
+    except (requests.exceptions.RequestException, ValueError) as e:
         logger.error(f"Error getting user profile for {user_id}: {str(e)}")
         return None
 
@@ -401,13 +489,10 @@ def test_api_connection() -> bool:
         bool: True if connection is working, False otherwise
     """
     try:
-        access_token = get_page_access_token()
-        
         # Test with a simple API call
-        url = "https://graph.facebook.com/v18.0/me"
-        params = {"access_token": access_token}
+        url = f"https://graph.facebook.com/v18.0/me?{_ACCESS_TOKEN_QUERY}"
         
-        response = requests.get(url, params=params, timeout=10)
+        response = get_http_session().get(url, timeout=10)
         
         if response.status_code == 200:
             logger.info("Meta API connection test successful")
@@ -416,6 +501,6 @@ def test_api_connection() -> bool:
             logger.error(f"Meta API connection test failed. Status: {response.status_code}")
             return False
             
-    except Exception as e:
+    except requests.exceptions.RequestException as e:
         logger.error(f"Error testing API connection: {str(e)}")
         return False
\ No newline at end of file
@@ -8,34 +8,54 @@ guiding users through multi-step interactions.
 
 import logging
 import re
+import sys
+import threading
+import types
+from enum import IntEnum
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
 from wallet_bot.messenger.api import (
     send_text_message, send_quick_replies, send_welcome_message,
-    send_confirmation_message, send_error_message, send_typing_indicator
+    send_confirmation_message, send_error_message, send_typing_indicator_async
 )
-from wallet_bot.sheets.handler import log_transaction, get_transactions_for_period, regenerate_formatted_report
+from wallet_bot.sheets.handler import log_transaction, get_transactions_for_period, schedule_report_regeneration
 from wallet_bot.analytics.generator import generate_report
-from wallet_bot.utils.timezone import format_manila_timestamp
+from wallet_bot.messenger.state_store import create_conversation_store
+from wallet_bot.utils.cache import TTLCache
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# In-memory conversation state storage
-# In production, this could be Redis or database
-conversation_states = {}
+# Conversation state storage: a bounded in-memory LRU, or Redis when REDIS_URL is set
+conversation_states = create_conversation_store()
+
+# Striped locks that serialize read-modify-write of one user's conversation entry
+# without blocking other users (a fixed array, so it doesn't grow per user)
+_USER_LOCK_STRIPES = [threading.Lock() for _ in range(64)]
+
+# Generated reports keyed by (user_id, period)
+# Entries expire after REPORT_CACHE_TTL seconds and are dropped when the user logs a transaction
+REPORT_CACHE_TTL = 60
+REPORT_CACHE_SIZE = 2048
+_report_cache = TTLCache(maxsize=REPORT_CACHE_SIZE, ttl=REPORT_CACHE_TTL)
+
+# Users who were sent a typing indicator in the last TYPING_DEBOUNCE_SECONDS;
+# quick back-and-forth turns don't need a fresh indicator every message
+TYPING_DEBOUNCE_SECONDS = 1.0
+TYPING_DEBOUNCE_SIZE = 2048
+_recent_typing = TTLCache(maxsize=TYPING_DEBOUNCE_SIZE, ttl=TYPING_DEBOUNCE_SECONDS)
 
 # Conversation states
-class ConversationState:
-    IDLE = "idle"
-    WAITING_EXPENSE_CATEGORY = "waiting_expense_category"
-    WAITING_EXPENSE_DESCRIPTION = "waiting_expense_description"
-    WAITING_EXPENSE_AMOUNT = "waiting_expense_amount"
-    WAITING_INCOME_SOURCE = "waiting_income_source"
-    WAITING_INCOME_DESCRIPTION = "waiting_income_description"
-    WAITING_INCOME_AMOUNT = "waiting_income_amount"
-    WAITING_STATS_PERIOD = "waiting_stats_period"
+class ConversationState(IntEnum):
+    IDLE = 0
+    WAITING_EXPENSE_CATEGORY = 1
+    WAITING_EXPENSE_DESCRIPTION = 2
+    WAITING_EXPENSE_AMOUNT = 3
+    WAITING_INCOME_SOURCE = 4
+    WAITING_INCOME_DESCRIPTION = 5
+    WAITING_INCOME_AMOUNT = 6
+    WAITING_STATS_PERIOD = 7
 
 # Predefined categories and sources
 EXPENSE_CATEGORIES = [
@@ -66,6 +86,38 @@ STATS_PERIODS = [
     {"title": "📆 This Month", "payload": "PERIOD_MONTH"}
 ]
 
+# Payload -> label lookups, derived from the option lists above (titles minus their emoji)
+_CATEGORY_MAP = types.MappingProxyType({c["payload"]: c["title"].split(" ", 1)[1] for c in EXPENSE_CATEGORIES})
+_SOURCE_MAP = types.MappingProxyType({s["payload"]: s["title"].split(" ", 1)[1] for s in INCOME_SOURCES})
+_PERIOD_MAP = types.MappingProxyType({p["payload"]: p["title"].split(" ", 1)[1] for p in STATS_PERIODS})
+
+# Amount parsing: strip currency symbols/separators, then accept plain decimals only
+_AMOUNT_CLEAN_RE = re.compile(r'[₱$,\s]')
+_AMOUNT_VALIDATE_RE = re.compile(r'(?:\d+(?:\.\d*)?|\.\d+)\Z')
+
+# Idle-state keywords, matched against the whole words of a message
+_WORD_RE = re.compile(r'\w+')
+_GREETING_WORDS = frozenset({"hi", "hello", "hey", "start", "menu"})
+_EXPENSE_WORDS = frozenset({"expense", "spend", "cost", "buy", "paid"})
+_INCOME_WORDS = frozenset({"income", "earn", "salary", "money", "receive"})
+_STATS_WORDS = frozenset({"stats", "report", "summary", "total", "view"})
+_HELP_WORDS = frozenset({"help", "what", "how"})
+
+# Reply to the "help" intent
+_HELP_TEXT = (
+    "🤖 **Messenger Wallet Bot Help**\n\n"
+    "I help you track income and expenses easily!\n\n"
+    "**Main Features:**\n"
+    "💸 Log Expense - Record money you spent\n"
+    "💰 Log Income - Record money you received\n"
+    "📊 View Statistics - See your financial reports\n\n"
+    "**Tips:**\n"
+    "• Use the quick reply buttons for fastest navigation\n"
+    "• Be specific with descriptions (e.g., 'Lunch at Jollibee')\n"
+    "• Enter amounts as numbers only (e.g., 150 or 1500.50)\n\n"
+    "Ready to get started?"
+)
+
 
 def process_webhook_message(payload: Dict[str, Any]) -> bool:
     """
@@ -75,30 +127,42 @@ def process_webhook_message(payload: Dict[str, Any]) -> bool:
         payload (Dict): The JSON payload from Meta's webhook
         
     Returns:
-        bool: True if message processed successfully, False otherwise
+        bool: True if every message event was handled successfully, False otherwise
     """
     try:
         # Extract messaging data
-        if "entry" not in payload:
+        entries = payload.get("entry")
+        if not entries:
             logger.warning("No 'entry' field in webhook payload")
             return False
-            
-        for entry in payload["entry"]:
-            if "messaging" not in entry:
-                continue
-                
-            for message_event in entry["messaging"]:
-                success = _handle_message_event(message_event)
-                if not success:
-                    logger.error(f"Failed to handle message event: {message_event}")
+        
+        # Fast path: the usual delivery is one entry with one message event
+        if len(entries) == 1:
+            messaging = entries[0].get("messaging")
+            if messaging and len(messaging) == 1:
+                return _handle_event_logging_failure(messaging[0])
+        
+        all_handled = True
+        for entry in entries:
+            for message_event in entry.get("messaging", ()):
+                if not _handle_event_logging_failure(message_event):
+                    all_handled = False
                     
-        return True
+        return all_handled
         
     except Exception as e:
-        logger.error(f"Error processing webhook message: {str(e)}")
+        logger.error("Error processing webhook message: %s", e)
         return False
 
 
+def _handle_event_logging_failure(event: Dict[str, Any]) -> bool:
+    """Handle one message event, logging it if handling fails."""
+    success = _handle_message_event(event)
+    if not success:
+        logger.error("Failed to handle message event: %s", event)
+    return success
+
+
 def _handle_message_event(event: Dict[str, Any]) -> bool:
     """
     Handle individual message events from the webhook.
@@ -121,14 +185,29 @@ def _handle_message_event(event: Dict[str, Any]) -> bool:
         elif "postback" in event:
             return _handle_postback(sender_id, event["postback"])
         else:
-            logger.info(f"Unhandled event type from {sender_id}")
+            logger.info("Unhandled event type from %s", sender_id)
             return True
             
     except Exception as e:
-        logger.error(f"Error handling message event: {str(e)}")
+        logger.error("Error handling message event: %s", e)
         return False
 
 
+def _send_typing_indicator_debounced(user_id: str) -> None:
+    """
+    Start a typing indicator for a user, unless one was sent within the last
+    TYPING_DEBOUNCE_SECONDS.
+    
+    Args:
+        user_id (str): The recipient's Facebook user ID
+    """
+    if _recent_typing.get(user_id) is not None:
+        return
+    
+    _recent_typing.set(user_id, True)
+    send_typing_indicator_async(user_id)
+
+
 def _handle_incoming_message(user_id: str, message: Dict[str, Any]) -> bool:
     """
     Handle incoming text messages and quick reply responses.
@@ -141,16 +220,18 @@ def _handle_incoming_message(user_id: str, message: Dict[str, Any]) -> bool:
         bool: True if handled successfully, False otherwise
     """
     try:
-        # Send typing indicator
-        send_typing_indicator(user_id)
-        
         # Handle quick reply responses
         if "quick_reply" in message:
-            payload = message["quick_reply"]["payload"]
+            # Send typing indicator in the background, overlapping with handling the message
+            _send_typing_indicator_debounced(user_id)
+            
+            # Interned so the payload comparisons and map lookups below match on identity
+            payload = sys.intern(message["quick_reply"]["payload"])
             return _handle_quick_reply(user_id, payload)
             
         # Handle text messages
         if "text" in message:
+            _send_typing_indicator_debounced(user_id)
             text = message["text"].strip()
             return _handle_text_message(user_id, text)
             
@@ -158,7 +239,7 @@ def _handle_incoming_message(user_id: str, message: Dict[str, Any]) -> bool:
         return _handle_unsupported_message(user_id)
         
     except Exception as e:
-        logger.error(f"Error handling incoming message from {user_id}: {str(e)}")
+        logger.error("Error handling incoming message from %s: %s", user_id, e)
         return send_error_message(user_id)
 
 
@@ -185,7 +266,7 @@ def _handle_postback(user_id: str, postback: Dict[str, Any]) -> bool:
         return _handle_quick_reply(user_id, payload)
         
     except Exception as e:
-        logger.error(f"Error handling postback from {user_id}: {str(e)}")
+        logger.error("Error handling postback from %s: %s", user_id, e)
         return send_error_message(user_id)
 
 
@@ -202,31 +283,27 @@ def _handle_quick_reply(user_id: str, payload: str) -> bool:
     """
     try:
         # Main menu options
-        if payload == "LOG_EXPENSE":
-            return _start_expense_logging(user_id)
-        elif payload == "LOG_INCOME":
-            return _start_income_logging(user_id)
-        elif payload == "VIEW_STATS":
-            return _start_stats_request(user_id)
+        handler = _QUICK_REPLY_DISPATCH.get(payload)
+        if handler is not None:
+            return handler(user_id)
             
         # Expense category selection
-        elif payload.startswith("CATEGORY_"):
+        if payload in _CATEGORY_MAP:
             return _handle_expense_category_selection(user_id, payload)
             
         # Income source selection
-        elif payload.startswith("SOURCE_"):
+        if payload in _SOURCE_MAP:
             return _handle_income_source_selection(user_id, payload)
             
         # Statistics period selection
-        elif payload.startswith("PERIOD_"):
+        if payload in _PERIOD_MAP:
             return _handle_stats_period_selection(user_id, payload)
             
-        else:
-            logger.warning(f"Unhandled quick reply payload: {payload}")
-            return send_error_message(user_id)
+        logger.warning("Unhandled quick reply payload: %s", payload)
+        return send_error_message(user_id)
             
     except Exception as e:
-        logger.error(f"Error handling quick reply from {user_id}: {str(e)}")
+        logger.error("Error handling quick reply from %s: %s", user_id, e)
         return send_error_message(user_id)
 
 
@@ -242,30 +319,22 @@ def _handle_text_message(user_id: str, text: str) -> bool:
         bool: True if handled successfully, False otherwise
     """
     try:
-        state = _get_conversation_state(user_id)
+        state = _get_entry(user_id)["state"]
+        
+        # Handle the expense/income flows that are waiting on free text
+        handler = _TEXT_HANDLERS.get(state)
+        if handler is not None:
+            return handler(user_id, text)
         
         # Handle greetings and common phrases
         if state == ConversationState.IDLE:
             return _handle_idle_text_message(user_id, text)
-            
-        # Handle expense flow
-        elif state == ConversationState.WAITING_EXPENSE_DESCRIPTION:
-            return _handle_expense_description(user_id, text)
-        elif state == ConversationState.WAITING_EXPENSE_AMOUNT:
-            return _handle_expense_amount(user_id, text)
-            
-        # Handle income flow
-        elif state == ConversationState.WAITING_INCOME_DESCRIPTION:
-            return _handle_income_description(user_id, text)
-        elif state == ConversationState.WAITING_INCOME_AMOUNT:
-            return _handle_income_amount(user_id, text)
-            
-        else:
-            logger.warning(f"Unhandled conversation state: {state}")
-            return _reset_and_show_menu(user_id)
+        
+        logger.warning("Unhandled conversation state: %s", state)
+        return _reset_and_show_menu(user_id)
             
     except Exception as e:
-        logger.error(f"Error handling text message from {user_id}: {str(e)}")
+        logger.error("Error handling text message from %s: %s", user_id, e)
         return send_error_message(user_id)
 
 
@@ -280,24 +349,15 @@ def _handle_idle_text_message(user_id: str, text: str) -> bool:
     Returns:
         bool: True if handled successfully, False otherwise
     """
-    text_lower = text.lower()
+    words = set(_WORD_RE.findall(text.lower()))
+    
+    # Pick the highest-priority intent mentioned anywhere in the text
+    for keywords, handler in _IDLE_INTENTS:
+        if words & keywords:
+            return handler(user_id)
     
-    # Greetings
-    if any(greeting in text_lower for greeting in ["hi", "hello", "hey", "start", "menu"]):
-        return send_welcome_message(user_id)
-        
-    # Direct commands
-    elif any(word in text_lower for word in ["expense", "spend", "cost", "buy", "paid"]):
-        return _start_expense_logging(user_id)
-    elif any(word in text_lower for word in ["income", "earn", "salary", "money", "receive"]):
-        return _start_income_logging(user_id)
-    elif any(word in text_lower for word in ["stats", "report", "summary", "total", "view"]):
-        return _start_stats_request(user_id)
-    elif any(word in text_lower for word in ["help", "what", "how"]):
-        return _send_help_message(user_id)
-    else:
-        # Default to showing menu
-        return send_welcome_message(user_id)
+    # Default to showing menu
+    return send_welcome_message(user_id)
 
 
 def _start_expense_logging(user_id: str) -> bool:
@@ -328,19 +388,7 @@ def _handle_expense_category_selection(user_id: str, payload: str) -> bool:
     """Handle expense category selection."""
     try:
         # Extract category from payload
-        category_map = {
-            "CATEGORY_FOOD": "Food",
-            "CATEGORY_TRANSPORT": "Transportation", 
-            "CATEGORY_HOUSING": "Housing",
-            "CATEGORY_SHOPPING": "Shopping",
-            "CATEGORY_UTILITIES": "Utilities",
-            "CATEGORY_ENTERTAINMENT": "Entertainment",
-            "CATEGORY_HEALTHCARE": "Healthcare",
-            "CATEGORY_EDUCATION": "Education",
-            "CATEGORY_OTHER": "Other"
-        }
-        
-        category = category_map.get(payload, "Other")
+        category = _CATEGORY_MAP.get(payload, "Other")
         
         # Store category in conversation state
         _update_conversation_data(user_id, {"expense_category": category})
@@ -350,7 +398,7 @@ def _handle_expense_category_selection(user_id: str, payload: str) -> bool:
         return send_text_message(user_id, text)
         
     except Exception as e:
-        logger.error(f"Error handling expense category selection: {str(e)}")
+        logger.error("Error handling expense category selection: %s", e)
         return send_error_message(user_id)
 
 
@@ -358,17 +406,7 @@ def _handle_income_source_selection(user_id: str, payload: str) -> bool:
     """Handle income source selection."""
     try:
         # Extract source from payload
-        source_map = {
-            "SOURCE_SALARY": "Salary",
-            "SOURCE_FREELANCE": "Freelance",
-            "SOURCE_BUSINESS": "Business",
-            "SOURCE_GIFT": "Gift",
-            "SOURCE_INVESTMENT": "Investment",
-            "SOURCE_REFUND": "Refund",
-            "SOURCE_OTHER": "Other"
-        }
-        
-        source = source_map.get(payload, "Other")
+        source = _SOURCE_MAP.get(payload, "Other")
         
         # Store source in conversation state
         _update_conversation_data(user_id, {"income_source": source})
@@ -378,26 +416,20 @@ def _handle_income_source_selection(user_id: str, payload: str) -> bool:
         return send_text_message(user_id, text)
         
     except Exception as e:
-        logger.error(f"Error handling income source selection: {str(e)}")
+        logger.error("Error handling income source selection: %s", e)
         return send_error_message(user_id)
 
 
 def _handle_stats_period_selection(user_id: str, payload: str) -> bool:
     """Handle statistics period selection."""
     try:
-        period_map = {
-            "PERIOD_TODAY": "Today",
-            "PERIOD_WEEK": "This Week",
-            "PERIOD_MONTH": "This Month"
-        }
-        
-        period = period_map.get(payload, "This Week")
+        period = _PERIOD_MAP.get(payload, "This Week")
         
         # Generate and send report
         return _generate_and_send_report(user_id, period)
         
     except Exception as e:
-        logger.error(f"Error handling stats period selection: {str(e)}")
+        logger.error("Error handling stats period selection: %s", e)
         return send_error_message(user_id)
 
 
@@ -415,7 +447,7 @@ def _handle_expense_description(user_id: str, description: str) -> bool:
         return send_text_message(user_id, text)
         
     except Exception as e:
-        logger.error(f"Error handling expense description: {str(e)}")
+        logger.error("Error handling expense description: %s", e)
         return send_error_message(user_id)
 
 
@@ -433,7 +465,7 @@ def _handle_income_description(user_id: str, description: str) -> bool:
         return send_text_message(user_id, text)
         
     except Exception as e:
-        logger.error(f"Error handling income description: {str(e)}")
+        logger.error("Error handling income description: %s", e)
         return send_error_message(user_id)
 
 
@@ -446,7 +478,7 @@ def _handle_expense_amount(user_id: str, amount_text: str) -> bool:
             return send_error_message(user_id, "invalid_amount")
             
         # Get stored data
-        conversation_data = _get_conversation_data(user_id)
+        conversation_data = _get_entry(user_id).get("data", {})
         category = conversation_data.get("expense_category", "Other")
         description = conversation_data.get("expense_description", "Expense")
         
@@ -460,7 +492,7 @@ def _handle_expense_amount(user_id: str, amount_text: str) -> bool:
         return send_confirmation_message(user_id, "expense", amount, description, category)
         
     except Exception as e:
-        logger.error(f"Error handling expense amount: {str(e)}")
+        logger.error("Error handling expense amount: %s", e)
         return send_error_message(user_id)
 
 
@@ -473,7 +505,7 @@ def _handle_income_amount(user_id: str, amount_text: str) -> bool:
             return send_error_message(user_id, "invalid_amount")
             
         # Get stored data
-        conversation_data = _get_conversation_data(user_id)
+        conversation_data = _get_entry(user_id).get("data", {})
         source = conversation_data.get("income_source", "Other")
         description = conversation_data.get("income_description", "Income")
         
@@ -487,7 +519,7 @@ def _handle_income_amount(user_id: str, amount_text: str) -> bool:
         return send_confirmation_message(user_id, "income", amount, description, source)
         
     except Exception as e:
-        logger.error(f"Error handling income amount: {str(e)}")
+        logger.error("Error handling income amount: %s", e)
         return send_error_message(user_id)
 
 
@@ -504,29 +536,21 @@ def _log_expense_transaction(user_id: str, amount: float, description: str, cate
         )
 
         if success:
+            _invalidate_report_cache(user_id)
+            
             # Trigger report regeneration in background
-            regenerate_formatted_report()
+            schedule_report_regeneration()
             
         return success
         
     except Exception as e:
-        logger.error(f"Error logging expense transaction: {str(e)}")
+        logger.error("Error logging expense transaction: %s", e)
         return False
 
 
 def _log_income_transaction(user_id: str, amount: float, description: str, source: str) -> bool:
     """Log income transaction to Google Sheets."""
     try:
-        # Prepare transaction data (using Manila timezone)
-        transaction_data = {
-            "timestamp": format_manila_timestamp(),
-            "user_id": user_id,
-            "type": "income",
-            "amount": amount,
-            "description": description,
-            "category": source  # Using category field for income source
-        }
-        
         # Log to sheets
         success = log_transaction(
             transaction_type='income',
@@ -537,21 +561,29 @@ def _log_income_transaction(user_id: str, amount: float, description: str, sourc
         ) # <--- THIS IS THE FIX
 
         if success:
+            _invalidate_report_cache(user_id)
+            
             # Trigger report regeneration in background
-            regenerate_formatted_report()
+            schedule_report_regeneration()
             
         return success
         
     except Exception as e:
-        logger.error(f"Error logging income transaction: {str(e)}")
+        logger.error("Error logging income transaction: %s", e)
         return False
 
 
 def _generate_and_send_report(user_id: str, period: str) -> bool:
     """Generate and send financial report to user."""
     try:
-        # Get transactions for period
-        transactions = get_transactions_for_period(period, user_id)
+        # Reuse a recent report if nothing has been logged since
+        report = _report_cache.get((user_id, period))
+        if report is not None:
+            _reset_conversation_state(user_id)
+            return send_text_message(user_id, report)
+        
+        # Get transactions for period as columns, which the report generator reads directly
+        transactions = get_transactions_for_period(period, user_id, columnar=True)
         
         if not transactions:
             text = f"📊 No transactions found for {period.lower()}.\n\nStart logging your income and expenses to see your financial report!"
@@ -560,23 +592,39 @@ def _generate_and_send_report(user_id: str, period: str) -> bool:
         
         # Generate report
         report = generate_report(transactions, period)
+        _report_cache.set((user_id, period), report)
         
         # Send report
         _reset_conversation_state(user_id)
         return send_text_message(user_id, report)
         
     except Exception as e:
-        logger.error(f"Error generating report: {str(e)}")
+        logger.error("Error generating report: %s", e)
         return send_error_message(user_id)
 
 
+def _invalidate_report_cache(user_id: str) -> None:
+    """Drop all cached reports for a user after they log a new transaction."""
+    for period in _PERIOD_MAP.values():
+        _report_cache.pop((user_id, period), None)
+
+
 def _parse_amount(amount_text: str) -> Optional[float]:
     """Parse amount text into float value."""
+    # Fast path for the common case of a plain whole number like "150"
+    # (isascii() because isdigit() also accepts digits int() can't parse, like "²")
+    if amount_text.isdigit() and amount_text.isascii() and len(amount_text) <= 7:
+        amount = int(amount_text)
+        return float(amount) if 0 < amount <= 1_000_000 else None
+
     try:
         # Remove common currency symbols and whitespace
-        cleaned = re.sub(r'[₱$,\s]', '', amount_text)
+        cleaned = _AMOUNT_CLEAN_RE.sub('', amount_text)
+        
+        # Reject anything that isn't a plain decimal number before calling float()
+        if not _AMOUNT_VALIDATE_RE.match(cleaned):
+            return None
         
-        # Try to convert to float
         amount = float(cleaned)
         
         # Validate reasonable range
@@ -597,21 +645,34 @@ def _handle_unsupported_message(user_id: str) -> bool:
 
 def _send_help_message(user_id: str) -> bool:
     """Send help message to user."""
-    help_text = (
-        "🤖 **Messenger Wallet Bot Help**\n\n"
-        "I help you track income and expenses easily!\n\n"
-        "**Main Features:**\n"
-        "💸 Log Expense - Record money you spent\n"
-        "💰 Log Income - Record money you received\n"
-        "📊 View Statistics - See your financial reports\n\n"
-        "**Tips:**\n"
-        "• Use the quick reply buttons for fastest navigation\n"
-        "• Be specific with descriptions (e.g., 'Lunch at Jollibee')\n"
-        "• Enter amounts as numbers only (e.g., 150 or 1500.50)\n\n"
-        "Ready to get started?"
-    )
-    
-    return send_welcome_message(user_id)
+    return send_text_message(user_id, _HELP_TEXT)
+
+
+# Idle-state keywords -> handler, in priority order (greetings first),
+# used by _handle_idle_text_message
+_IDLE_INTENTS = (
+    (_GREETING_WORDS, send_welcome_message),
+    (_EXPENSE_WORDS, _start_expense_logging),
+    (_INCOME_WORDS, _start_income_logging),
+    (_STATS_WORDS, _start_stats_request),
+    (_HELP_WORDS, _send_help_message)
+)
+
+
+# Main menu payload -> handler, used by _handle_quick_reply
+_QUICK_REPLY_DISPATCH = {
+    "LOG_EXPENSE": _start_expense_logging,
+    "LOG_INCOME": _start_income_logging,
+    "VIEW_STATS": _start_stats_request
+}
+
+# Conversation state -> free-text handler, used by _handle_text_message
+_TEXT_HANDLERS = {
+    ConversationState.WAITING_EXPENSE_DESCRIPTION: _handle_expense_description,
+    ConversationState.WAITING_EXPENSE_AMOUNT: _handle_expense_amount,
+    ConversationState.WAITING_INCOME_DESCRIPTION: _handle_income_description,
+    ConversationState.WAITING_INCOME_AMOUNT: _handle_income_amount
+}
 
 
 def _reset_and_show_menu(user_id: str) -> bool:
@@ -621,32 +682,41 @@ def _reset_and_show_menu(user_id: str) -> bool:
 
 
 # Conversation state management functions
-def _get_conversation_state(user_id: str) -> str:
-    """Get the current conversation state for a user."""
-    return conversation_states.get(user_id, {}).get("state", ConversationState.IDLE)
+def _get_entry(user_id: str) -> Dict[str, Any]:
+    """
+    Get a user's conversation entry with a single store lookup.
+    
+    Returns:
+        Dict: The entry ({"state": ..., "data": {...}}); a fresh idle entry if the user is unknown
+    """
+    entry = conversation_states.get(user_id)
+    if entry is None:
+        return {"state": ConversationState.IDLE, "data": {}}
+    return entry
 
 
-def _set_conversation_state(user_id: str, state: str) -> None:
-    """Set the conversation state for a user."""
-    if user_id not in conversation_states:
-        conversation_states[user_id] = {}
-    conversation_states[user_id]["state"] = state
+def _lock_for(user_id: str) -> threading.Lock:
+    """Get the lock stripe guarding a user's conversation entry."""
+    return _USER_LOCK_STRIPES[hash(user_id) & 63]
 
 
-def _get_conversation_data(user_id: str) -> Dict[str, Any]:
-    """Get the conversation data for a user."""
-    return conversation_states.get(user_id, {}).get("data", {})
+def _set_conversation_state(user_id: str, state: ConversationState) -> None:
+    """Set the conversation state for a user."""
+    with _lock_for(user_id):
+        entry = _get_entry(user_id)
+        entry["state"] = state
+        conversation_states.set(user_id, entry)
 
 
 def _update_conversation_data(user_id: str, data: Dict[str, Any]) -> None:
     """Update conversation data for a user."""
-    if user_id not in conversation_states:
-        conversation_states[user_id] = {"state": ConversationState.IDLE, "data": {}}
-    if "data" not in conversation_states[user_id]:
-        conversation_states[user_id]["data"] = {}
-    conversation_states[user_id]["data"].update(data)
+    with _lock_for(user_id):
+        entry = _get_entry(user_id)
+        entry.setdefault("data", {}).update(data)
+        conversation_states.set(user_id, entry)
 
 
 def _reset_conversation_state(user_id: str) -> None:
     """Reset conversation state for a user."""
-    conversation_states[user_id] = {"state": ConversationState.IDLE, "data": {}}
\ No newline at end of file
+    with _lock_for(user_id):
+        conversation_states.set(user_id, {"state": ConversationState.IDLE, "data": {}})
@@ -0,0 +1,101 @@
+"""
+Conversation State Store Module
+
+This module holds the per-user conversation state used by the messenger handler.
+By default state is kept in a bounded in-memory LRU, and in both backends a
+conversation expires after CONVERSATION_TTL seconds without a write, so users who
+abandon a flow neither hold on to memory forever nor come back stuck in it. When
+REDIS_URL is set, state is kept in Redis instead, which shares it between Gunicorn workers.
+"""
+
+import logging
+import os
+from typing import Dict, Any, Optional
+
+import orjson
+
+from wallet_bot.utils.cache import TTLCache
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Maximum number of users kept by the in-memory store
+CONVERSATION_STORE_SIZE = int(os.getenv('CONVERSATION_STORE_SIZE', '50000'))
+
+# Seconds an idle conversation is kept before it resets
+CONVERSATION_TTL = int(os.getenv('CONVERSATION_TTL', '1800'))
+
+
+class ConversationStore:
+    """In-memory LRU store of conversation entries, keyed by user ID, with a per-user idle TTL."""
+
+    def __init__(self, maxsize: int = CONVERSATION_STORE_SIZE, ttl: int = CONVERSATION_TTL):
+        self._entries = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def get(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a user's conversation entry, marking it as recently used.
+
+        Returns:
+            Dict or None: The entry ({"state": ..., "data": {...}}), or None if unknown or expired
+        """
+        return self._entries.get(user_id)
+
+    def set(self, user_id: str, entry: Dict[str, Any]) -> None:
+        """Store a user's conversation entry and restart its idle TTL, evicting the least recently used if full."""
+        self._entries.set(user_id, entry)
+
+    def delete(self, user_id: str) -> None:
+        """Forget a user's conversation entry."""
+        self._entries.pop(user_id)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisConversationStore:
+    """Redis-backed store of conversation entries with a per-user idle TTL."""
+
+    def __init__(self, redis_url: str, ttl: int = CONVERSATION_TTL):
+        # Optional dependency, only needed when REDIS_URL is configured
+        import redis
+
+        self._redis = redis.Redis.from_url(redis_url)
+        self._ttl = ttl
+
+    @staticmethod
+    def _key(user_id: str) -> str:
+        return f"conversation:{user_id}"
+
+    def get(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a user's conversation entry.
+
+        Returns:
+            Dict or None: The entry ({"state": ..., "data": {...}}), or None if unknown or expired
+        """
+        raw = self._redis.get(self._key(user_id))
+        return orjson.loads(raw) if raw else None
+
+    def set(self, user_id: str, entry: Dict[str, Any]) -> None:
+        """Store a user's conversation entry and restart its idle TTL."""
+        self._redis.set(self._key(user_id), orjson.dumps(entry), ex=self._ttl)
+
+    def delete(self, user_id: str) -> None:
+        """Forget a user's conversation entry."""
+        self._redis.delete(self._key(user_id))
+
+
+def create_conversation_store():
+    """
+    Create the conversation store for this process.
+
+    Returns:
+        RedisConversationStore if REDIS_URL is set, otherwise an in-memory ConversationStore
+    """
+    redis_url = os.getenv('REDIS_URL')
+    if redis_url:
+        logger.info("Using Redis for conversation state")
+        return RedisConversationStore(redis_url)
+
+    return ConversationStore()
@@ -10,5 +10,8 @@
 from .handler import (
     log_transaction,
     get_transactions_for_period,
-    regenerate_formatted_report
+    regenerate_formatted_report,
+    schedule_report_regeneration,
+    batched_writes,
+    flush_pending_writes
 )
\ No newline at end of file
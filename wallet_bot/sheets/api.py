@@ -1,24 +1,137 @@
+import atexit
+import contextvars
+import functools
 import gspread
 import logging
 import os
 import json
-from typing import List, Dict, Any, Optional
+import math
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, Future
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterator, Optional
 from google.oauth2.service_account import Credentials
+from google.auth.transport.requests import AuthorizedSession
 from gspread.exceptions import APIError, SpreadsheetNotFound, WorksheetNotFound
+from gspread.utils import a1_range_to_grid_range, absolute_range_name, fill_gaps, numericise, rowcol_to_a1
 
 # --- THIS IS THE CRITICAL FIX ---
 # We import the 'config' object and the 'get_google_sheet_id' function.
 # We will use the 'config' object to call the get_credentials_path method.
 from wallet_bot.config.settings import config, get_google_sheet_id
 # -----------------------------
+from wallet_bot.utils.http import RETRY_STATUSES, mount_pooled_adapter
+from wallet_bot.utils.cache import TTLCache
 
-# Set up logging
+# Set up logging; the NullHandler keeps library use without logging config quiet
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 # Global variables for connection management
 _gc = None
 _spreadsheet = None
 
+# Worksheet handles by name, and the sheets whose required columns were already
+# checked; looking a worksheet up by name costs a metadata request each time.
+# Handles expire after WORKSHEET_CACHE_TTL seconds so a tab deleted or renamed
+# by hand in the spreadsheet is looked up again instead of used forever.
+WORKSHEET_CACHE_TTL = 300.0
+_worksheet_cache = TTLCache(maxsize=64, ttl=WORKSHEET_CACHE_TTL)
+_columns_ensured = set()
+
+# Guards the lazy creation of _gc and _spreadsheet, so concurrent first calls
+# don't each authenticate and open the spreadsheet (re-entrant: opening the
+# spreadsheet authenticates first)
+_init_lock = threading.RLock()
+
+# Service account credentials, kept across reset_connection() so re-authenticating
+# doesn't re-read and re-parse the key. For file-based credentials the file's
+# (path, st_mtime_ns) is kept too, so a replaced key file is loaded again.
+_credentials = None
+_credentials_file_stamp = None
+
+# Where else to look for the credentials file when the configured path doesn't
+# exist (Render deployments); relative paths are resolved against the cwd
+_ALTERNATIVE_CREDENTIALS_PATHS = (
+    '/opt/render/project/credentials.json',
+    '/opt/render/project/src/credentials.json',
+    'credentials.json'
+)
+
+# Scopes for Google Sheets and Drive APIs
+_SCOPES = (
+    'https://spreadsheets.google.com/feeds',
+    'https://www.googleapis.com/auth/drive'
+)
+
+# Background writer for append_row(): queued rows are sent with one append_rows
+# call per sheet every APPEND_FLUSH_INTERVAL seconds, or sooner once a sheet has
+# APPEND_FLUSH_ROWS rows waiting
+APPEND_FLUSH_INTERVAL = 0.5
+APPEND_FLUSH_ROWS = 50
+_pending_rows: Dict[str, List[List[Any]]] = {}
+_pending_lock = threading.Lock()
+_pending_event = threading.Event()
+_flush_lock = threading.Lock()  # One flush at a time, so rows reach each sheet in order
+_writer_thread = None
+
+# A sheet whose queued rows fail to write is retried with exponential backoff
+# (APPEND_FLUSH_INTERVAL doubling up to APPEND_RETRY_MAX_DELAY). After
+# APPEND_MAX_FAILED_FLUSHES failures in a row its rows are logged in full and
+# parked in _parked_rows, so the writer stops hammering a sheet it can't reach;
+# they go back to the front of the queue as soon as a later flush of the sheet
+# succeeds, and are retried every APPEND_PARKED_RETRY_INTERVAL seconds until
+# then. Rows the API refuses outright (HTTP 400, e.g. an invalid value) are
+# split out of their batch so the other rows still get written, and kept in
+# _rejected_rows. Forced flushes (shutdown, exit) retry both once more and raise
+# if any row still can't be written. Only touched with _flush_lock held.
+APPEND_RETRY_MAX_DELAY = 60.0
+APPEND_MAX_FAILED_FLUSHES = 8
+APPEND_PARKED_RETRY_INTERVAL = 300.0
+_failed_flushes: Dict[str, int] = {}
+_retry_at: Dict[str, float] = {}
+_parked_rows: Dict[str, List[List[Any]]] = {}
+_rejected_rows: Dict[str, List[List[Any]]] = {}
+
+# get_all_records()/get_all_values() results, keyed by (sheet_name, 'records' | 'values').
+# Writes through this module drop the sheet's entries; READ_CACHE_TTL bounds how
+# stale a read can be when another process writes to the sheet.
+READ_CACHE_TTL = 30.0
+_read_cache = TTLCache(maxsize=32, ttl=READ_CACHE_TTL)
+
+# Raw values kept past READ_CACHE_TTL as sheet_name -> (revision, values), where
+# revision is the spreadsheet's Drive modifiedTime when they were read (None if
+# it wasn't asked for). Once the read cache expires, a sheet is only downloaded
+# again if the spreadsheet has changed since; checking costs one small Drive
+# request instead of every row.
+READ_SNAPSHOT_TTL = 3600.0
+_read_snapshots = TTLCache(maxsize=32, ttl=READ_SNAPSHOT_TTL)
+_revision_unavailable = False  # Set once the Drive API refuses, to stop asking
+
+# Thread pool for the *_async read functions; the pooled HTTP session lets
+# their requests run side by side instead of one after another
+SHEETS_IO_MAX_WORKERS = 8
+_io_executor = None
+_io_executor_lock = threading.Lock()
+
+# update_range() calls buffered by coalesced_updates(), as sheet name -> batch_update entries
+_update_buffer = contextvars.ContextVar('sheets_update_buffer', default=None)
+
+# Retries for Sheets calls rejected with HTTP 429 (quota exceeded), or failed with
+# a transient 5xx when the call is safe to repeat: wait for the server's
+# Retry-After, or back off exponentially, before trying again
+RATE_LIMIT_MAX_ATTEMPTS = 6
+RATE_LIMIT_BASE_DELAY = 0.5
+RATE_LIMIT_MAX_DELAY = 60.0
+
+# Most Sheets requests in flight at once across all threads of this process
+# (request handlers, background writer, report rebuilds and the I/O pool), so
+# bursts queue up here instead of tripping the per-user quota
+SHEETS_MAX_CONCURRENT_REQUESTS = 8
+_request_slots = threading.BoundedSemaphore(SHEETS_MAX_CONCURRENT_REQUESTS)
+
 # Default worksheet configurations
 DEFAULT_WORKSHEET_CONFIGS = {
     'Data_Log': {
@@ -58,10 +171,124 @@ REQUIRED_COLUMNS = {
 }
 
 
+def _retry_on_rate_limit(fn, idempotent: bool = False):
+    """
+    Wrap a Sheets API call so rate-limited (HTTP 429) attempts are retried.
+    
+    A 429 means the request was rejected before it took effect, so retrying
+    is safe even for appends. Transient server errors (5xx) may come after
+    the request took effect, so they are only retried for idempotent POST
+    calls (overwriting or clearing fixed ranges); GET and PUT requests are
+    already retried on 5xx by the session's HTTP adapter. Other errors are
+    raised straight away. Each attempt also waits for one of the
+    SHEETS_MAX_CONCURRENT_REQUESTS slots; the backoff sleep happens outside
+    the slot.
+    
+    Args:
+        fn: The API call to wrap, e.g. worksheet.append_rows
+        idempotent (bool): Whether the call can safely be repeated after a 5xx
+    
+    Returns:
+        The wrapped callable
+    """
+    retry_statuses = RETRY_STATUSES if idempotent else (429,)
+    
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        for attempt in range(1, RATE_LIMIT_MAX_ATTEMPTS + 1):
+            try:
+                with _request_slots:
+                    return fn(*args, **kwargs)
+            except APIError as e:
+                status = e.response.status_code
+                if status not in retry_statuses or attempt == RATE_LIMIT_MAX_ATTEMPTS:
+                    raise
+                delay = _rate_limit_delay(e.response, attempt)
+                logger.warning("Sheets API returned HTTP %s, retrying in %.1fs (attempt %s/%s)", status, delay, attempt, RATE_LIMIT_MAX_ATTEMPTS)
+                time.sleep(delay)
+    return wrapper
+
+
+def _rate_limit_delay(response, attempt: int) -> float:
+    """Seconds to wait before retrying: Retry-After if given, else exponential backoff, plus jitter."""
+    try:
+        delay = float(response.headers.get('Retry-After'))
+    except (TypeError, ValueError):
+        delay = RATE_LIMIT_BASE_DELAY * 2 ** (attempt - 1)
+    return min(delay, RATE_LIMIT_MAX_DELAY) + random.uniform(0, 0.25)
+
+
+def _format_values(rows: List[List[Any]]) -> List[List[Any]]:
+    """
+    Prepare cells for the API (see _normalize_cell).
+    
+    Rows that are already all strings, ints and finite floats (the usual case,
+    e.g. transactions with their amount) are passed through as they are
+    instead of being rebuilt.
+    """
+    isfinite = math.isfinite
+    return [
+        row if all(
+            type(cell) is str or type(cell) is int or (type(cell) is float and isfinite(cell))
+            for cell in row
+        )
+        else list(map(_normalize_cell, row))
+        for row in rows
+    ]
+
+
+def _normalize_cell(value: Any) -> Any:
+    """
+    Prepare one cell value for the API: None becomes "", finite ints and floats
+    are sent as JSON numbers, and anything else (bools included) as its str().
+    
+    Values are written RAW, so strings are stored exactly as given and never
+    parsed as numbers, dates or formulas.
+    """
+    if value is None:
+        return ""
+    value_type = value.__class__
+    if value_type is str or value_type is int:
+        return value
+    if value_type is float and math.isfinite(value):
+        return value
+    return str(value)
+
+
+def _authorize(credentials: Credentials) -> gspread.Client:
+    """
+    Create a gspread client whose authorized session uses the pooled HTTPS adapter.
+    
+    The pool only needs one connection per request slot, and 429s are left to
+    _retry_on_rate_limit() so they aren't retried at two layers at once.
+    """
+    session = mount_pooled_adapter(
+        AuthorizedSession(credentials),
+        pool_maxsize=SHEETS_MAX_CONCURRENT_REQUESTS,
+        retry_statuses=tuple(status for status in RETRY_STATUSES if status != 429)
+    )
+    return gspread.authorize(credentials, session=session)
+
+
 def _authenticate() -> gspread.Client:
+    """
+    Get the authenticated gspread client, creating it on first use.
+    
+    Returns:
+        gspread.Client: Authenticated client instance
+    """
+    if _gc is not None:
+        return _gc
+    
+    with _init_lock:
+        return _create_client()
+
+
+def _create_client() -> gspread.Client:
     """
     Authenticate with Google Sheets API using service account credentials.
     Supports both environment variable and file-based authentication.
+    Called with _init_lock held.
     
     Returns:
         gspread.Client: Authenticated client instance
@@ -69,17 +296,18 @@ def _authenticate() -> gspread.Client:
     Raises:
         Exception: If authentication fails or credentials are not found
     """
-    global _gc
+    global _gc, _credentials, _credentials_file_stamp
     
     if _gc is not None:
         return _gc
     
+    # Reuse credentials loaded by an earlier connection, unless their file changed
+    if _credentials is not None and not _credentials_file_changed():
+        _gc = _authorize(_credentials)
+        return _gc
+    
     try:
-        # Define the scope for Google Sheets and Drive APIs
-        scope = [
-            'https://spreadsheets.google.com/feeds',
-            'https://www.googleapis.com/auth/drive'
-        ]
+        scope = _SCOPES
         
         # Method 1: Try to get credentials from environment variable first
         credentials_json = os.environ.get('GOOGLE_CREDENTIALS_JSON')
@@ -91,66 +319,84 @@ def _authenticate() -> gspread.Client:
                     credentials_info, 
                     scopes=scope
                 )
-                _gc = gspread.authorize(credentials)
+                _gc = _authorize(credentials)
+                _credentials = credentials
+                _credentials_file_stamp = None
                 logger.info("Successfully authenticated with Google Sheets API using environment variable")
                 return _gc
             except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON in GOOGLE_CREDENTIALS_JSON environment variable: {e}")
+                logger.error("Invalid JSON in GOOGLE_CREDENTIALS_JSON environment variable: %s", e)
                 # Fall through to file-based method
             except Exception as e:
-                logger.error(f"Failed to authenticate using environment variable: {e}")
+                logger.error("Failed to authenticate using environment variable: %s", e)
                 # Fall through to file-based method
         
         # Method 2: Try file-based authentication
         logger.info("Attempting file-based authentication")
         credentials_path = config.get_credentials_path()
-        logger.info(f"Looking for credentials file at: {credentials_path}")
+        logger.info("Looking for credentials file at: %s", credentials_path)
         
         # Check if the file exists
         if not os.path.exists(credentials_path):
-            # Try alternative paths for Render deployment
-            alternative_paths = [
-                '/opt/render/project/credentials.json',
-                '/opt/render/project/src/credentials.json',
-                os.path.join(os.getcwd(), 'credentials.json'),
-                'credentials.json'
-            ]
-            
-            logger.info(f"File not found at {credentials_path}, trying alternative paths...")
-            credentials_path = None
-            
-            for alt_path in alternative_paths:
-                logger.info(f"Checking: {alt_path}")
-                if os.path.exists(alt_path):
-                    credentials_path = alt_path
-                    logger.info(f"Found credentials file at: {alt_path}")
-                    break
-            
+            logger.info("File not found at %s, trying alternative paths: %s", credentials_path, _ALTERNATIVE_CREDENTIALS_PATHS)
+            credentials_path = next((path for path in _ALTERNATIVE_CREDENTIALS_PATHS if os.path.exists(path)), None)
             if not credentials_path:
-                raise FileNotFoundError(f"Credentials file not found. Tried: {[config.get_credentials_path()] + alternative_paths}")
+                raise FileNotFoundError(f"Credentials file not found. Tried: {[config.get_credentials_path()] + list(_ALTERNATIVE_CREDENTIALS_PATHS)}")
+            logger.info("Found credentials file at: %s", credentials_path)
         
-        # Load credentials from the service account file
+        # Load credentials from the service account file, noting its mtime first
+        # so a change made while reading it is still seen next time
+        file_stamp = (credentials_path, os.stat(credentials_path).st_mtime_ns)
         credentials = Credentials.from_service_account_file(
             credentials_path, 
             scopes=scope
         )
         
         # Authorize and create client
-        _gc = gspread.authorize(credentials)
-        logger.info(f"Successfully authenticated with Google Sheets API using file: {credentials_path}")
+        _gc = _authorize(credentials)
+        _credentials = credentials
+        _credentials_file_stamp = file_stamp
+        logger.info("Successfully authenticated with Google Sheets API using file: %s", credentials_path)
         return _gc
         
     except FileNotFoundError as e:
-        logger.error(f"Credentials file not found: {str(e)}")
+        logger.error("Credentials file not found: %s", e)
         raise Exception("Google Service Account credentials file not found")
     except Exception as e:
-        logger.error(f"Authentication failed: {str(e)}")
+        logger.error("Authentication failed: %s", e)
         raise Exception(f"Failed to authenticate with Google Sheets API: {str(e)}")
 
 
+def _credentials_file_changed() -> bool:
+    """Check whether the file the cached credentials came from has been modified since."""
+    if _credentials_file_stamp is None:
+        return False
+    
+    path, mtime_ns = _credentials_file_stamp
+    try:
+        return os.stat(path).st_mtime_ns != mtime_ns
+    except OSError:
+        # Gone or unreadable: keep using the credentials already loaded
+        return False
+
+
 def _get_spreadsheet() -> gspread.Spreadsheet:
     """
-    Get the Google Spreadsheet instance.
+    Get the Google Spreadsheet instance, opening it on first use.
+    
+    Returns:
+        gspread.Spreadsheet: The spreadsheet instance
+    """
+    if _spreadsheet is not None:
+        return _spreadsheet
+    
+    with _init_lock:
+        return _open_spreadsheet()
+
+
+def _open_spreadsheet() -> gspread.Spreadsheet:
+    """
+    Open the Google Spreadsheet. Called with _init_lock held.
     
     Returns:
         gspread.Spreadsheet: The spreadsheet instance
@@ -166,18 +412,35 @@ def _get_spreadsheet() -> gspread.Spreadsheet:
     try:
         gc = _authenticate()
         sheet_id = get_google_sheet_id()
-        _spreadsheet = gc.open_by_key(sheet_id)
-        logger.info(f"Successfully opened spreadsheet: {_spreadsheet.title}")
+        spreadsheet = _retry_on_rate_limit(gc.open_by_key)(sheet_id)
+        logger.info("Successfully opened spreadsheet: %s", spreadsheet.title)
+        
+        _prefetch_worksheets(spreadsheet)
+        _spreadsheet = spreadsheet
         return _spreadsheet
         
     except SpreadsheetNotFound:
-        logger.error(f"Spreadsheet not found with ID: {get_google_sheet_id()}")
+        logger.error("Spreadsheet not found with ID: %s", sheet_id)
         raise Exception("Google Spreadsheet not found or not accessible")
     except Exception as e:
-        logger.error(f"Failed to open spreadsheet: {str(e)}")
+        logger.error("Failed to open spreadsheet: %s", e)
         raise Exception(f"Failed to access Google Spreadsheet: {str(e)}")
 
 
+def _prefetch_worksheets(spreadsheet: gspread.Spreadsheet) -> None:
+    """
+    Fill the worksheet handle cache for every tab with one metadata request,
+    instead of one request per sheet the first time each is used.
+    """
+    try:
+        for worksheet in _retry_on_rate_limit(spreadsheet.worksheets)():
+            _worksheet_cache.set(worksheet.title, worksheet)
+        logger.info("Prefetched %d worksheet handles", len(_worksheet_cache))
+    except Exception as e:
+        # Not fatal: get_worksheet() looks sheets up one by one instead
+        logger.warning("Failed to prefetch worksheets: %s", e)
+
+
 def normalize_column_name(column_name: str) -> str:
     """
     Normalize column names for consistent comparison.
@@ -201,13 +464,13 @@ def get_existing_headers(worksheet: gspread.Worksheet) -> List[str]:
     """
     try:
         # Get the first row (headers)
-        headers = worksheet.row_values(1)
+        headers = _retry_on_rate_limit(worksheet.row_values)(1)
         # Normalize headers for comparison
         normalized_headers = [normalize_column_name(header) for header in headers if header.strip()]
-        logger.debug(f"Existing headers in {worksheet.title}: {normalized_headers}")
+        logger.debug("Existing headers in %s: %s", worksheet.title, normalized_headers)
         return normalized_headers
     except Exception as e:
-        logger.warning(f"Could not get existing headers from {worksheet.title}: {e}")
+        logger.warning("Could not get existing headers from %s: %s", worksheet.title, e)
         return []
 
 
@@ -234,13 +497,13 @@ def ensure_columns_exist(worksheet: gspread.Worksheet, required_columns: List[st
                 missing_columns.append(req_col)
         
         if not missing_columns:
-            logger.debug(f"All required columns exist in {worksheet.title}")
+            logger.debug("All required columns exist in %s", worksheet.title)
             return True
         
-        logger.info(f"Missing columns in {worksheet.title}: {missing_columns}")
+        logger.info("Missing columns in %s: %s", worksheet.title, missing_columns)
         
         # Get current headers (including empty ones to preserve positioning)
-        current_row = worksheet.row_values(1)
+        current_row = _retry_on_rate_limit(worksheet.row_values)(1)
         if not current_row:
             current_row = []
         
@@ -263,18 +526,18 @@ def ensure_columns_exist(worksheet: gspread.Worksheet, required_columns: List[st
         if len(updated_headers) > worksheet.col_count:
             # Need to add more columns to the worksheet
             cols_to_add = len(updated_headers) - worksheet.col_count
-            worksheet.add_cols(cols_to_add)
-            logger.info(f"Added {cols_to_add} columns to {worksheet.title}")
+            _retry_on_rate_limit(worksheet.add_cols)(cols_to_add)
+            logger.info("Added %s columns to %s", cols_to_add, worksheet.title)
         
         # Update the first row with new headers
         range_to_update = f"1:{len(updated_headers)}"
-        worksheet.update(range_to_update, [updated_headers])
+        _retry_on_rate_limit(worksheet.update)(range_to_update, [updated_headers])
         
-        logger.info(f"Successfully added missing columns to {worksheet.title}: {missing_columns}")
+        logger.info("Successfully added missing columns to %s: %s", worksheet.title, missing_columns)
         return True
         
     except Exception as e:
-        logger.error(f"Failed to ensure columns exist in {worksheet.title}: {e}")
+        logger.error("Failed to ensure columns exist in %s: %s", worksheet.title, e)
         return False
 
 
@@ -297,36 +560,64 @@ def create_worksheet(sheet_name: str, rows: int = 1000, cols: int = 26, headers:
     try:
         spreadsheet = _get_spreadsheet()
         
-        # Create the worksheet
-        worksheet = spreadsheet.add_worksheet(title=sheet_name, rows=rows, cols=cols)
-        logger.info(f"Successfully created worksheet: '{sheet_name}' with {rows} rows and {cols} columns")
-        
-        # Add headers if provided
+        # Create the worksheet and write its headers in one batchUpdate request
+        response = _retry_on_rate_limit(spreadsheet.batch_update)(
+            {'requests': _add_sheet_requests(sheet_name, rows, cols, headers)}
+        )
+        properties = response['replies'][0]['addSheet']['properties']
+        worksheet = gspread.Worksheet(spreadsheet, properties, spreadsheet.id, spreadsheet.client)
+        logger.info("Successfully created worksheet: '%s' with %s rows and %s columns", sheet_name, rows, cols)
         if headers:
-            try:
-                # Convert headers to strings and pad with empty strings if needed
-                formatted_headers = [str(header) for header in headers]
-                if len(formatted_headers) > cols:
-                    logger.warning(f"Headers ({len(formatted_headers)}) exceed columns ({cols}). Truncating.")
-                    formatted_headers = formatted_headers[:cols]
-                elif len(formatted_headers) < cols:
-                    formatted_headers.extend([''] * (cols - len(formatted_headers)))
-                
-                worksheet.update('1:1', [formatted_headers])
-                logger.info(f"Successfully added {len(headers)} headers to worksheet '{sheet_name}'")
-            except Exception as e:
-                logger.warning(f"Failed to add headers to worksheet '{sheet_name}': {str(e)}")
+            logger.info("Successfully added %d headers to worksheet '%s'", len(headers), sheet_name)
         
         return worksheet
         
     except APIError as e:
-        logger.error(f"API error when creating worksheet '{sheet_name}': {str(e)}")
+        logger.error("API error when creating worksheet '%s': %s", sheet_name, e)
         raise Exception(f"Failed to create worksheet due to API error: {str(e)}")
     except Exception as e:
-        logger.error(f"Failed to create worksheet '{sheet_name}': {str(e)}")
+        logger.error("Failed to create worksheet '%s': %s", sheet_name, e)
         raise Exception(f"Failed to create worksheet: {str(e)}")
 
 
+def _add_sheet_requests(sheet_name: str, rows: int, cols: int, headers: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Build the batchUpdate requests that add a sheet and, if given, fill in its header row.
+    
+    The sheet ID is picked here rather than by the API, so the header
+    updateCells request can refer to the new sheet within the same batch.
+    """
+    sheet_id = random.randint(1, 2 ** 31 - 1)
+    requests = [{'addSheet': {'properties': {
+        'sheetId': sheet_id,
+        'title': sheet_name,
+        'sheetType': 'GRID',
+        'gridProperties': {'rowCount': rows, 'columnCount': cols}
+    }}}]
+    
+    if headers:
+        requests.append({'updateCells': {
+            'start': {'sheetId': sheet_id, 'rowIndex': 0, 'columnIndex': 0},
+            'rows': [{'values': [
+                {'userEnteredValue': {'stringValue': header}} if header else {}
+                for header in _format_headers(headers, cols)
+            ]}],
+            'fields': 'userEnteredValue'
+        }})
+    return requests
+
+
+def _format_headers(headers: List[str], cols: int) -> List[str]:
+    """Convert headers to strings, truncated or padded with empty strings to cols columns."""
+    formatted_headers = [str(header) for header in headers]
+    if len(formatted_headers) > cols:
+        logger.warning("Headers (%d) exceed columns (%s). Truncating.", len(formatted_headers), cols)
+        formatted_headers = formatted_headers[:cols]
+    elif len(formatted_headers) < cols:
+        formatted_headers.extend([''] * (cols - len(formatted_headers)))
+    return formatted_headers
+
+
 def get_worksheet(sheet_name: str, auto_create: bool = True, ensure_columns: bool = True) -> gspread.Worksheet:
     """
     Get a specific worksheet by name. Creates it if it doesn't exist and auto_create is True.
@@ -342,20 +633,33 @@ def get_worksheet(sheet_name: str, auto_create: bool = True, ensure_columns: boo
     Raises:
         Exception: If worksheet cannot be found or accessed
     """
+    worksheet = _worksheet_cache.get(sheet_name)
+    if worksheet is not None and (not ensure_columns or sheet_name in _columns_ensured):
+        return worksheet
+    
     try:
-        spreadsheet = _get_spreadsheet()
-        worksheet = spreadsheet.worksheet(sheet_name)
-        logger.debug(f"Successfully accessed existing worksheet: {sheet_name}")
+        if worksheet is None:
+            spreadsheet = _get_spreadsheet()
+            
+            # Opening the spreadsheet may have just prefetched it
+            worksheet = _worksheet_cache.get(sheet_name)
+            if worksheet is None:
+                worksheet = _retry_on_rate_limit(spreadsheet.worksheet)(sheet_name)
+                _worksheet_cache.set(sheet_name, worksheet)
+                logger.debug("Successfully accessed existing worksheet: %s", sheet_name)
         
         # Ensure required columns exist if requested
-        if ensure_columns and sheet_name in REQUIRED_COLUMNS:
-            ensure_columns_exist(worksheet, REQUIRED_COLUMNS[sheet_name])
+        if ensure_columns:
+            if sheet_name in REQUIRED_COLUMNS:
+                ensure_columns_exist(worksheet, REQUIRED_COLUMNS[sheet_name])
+            _columns_ensured.add(sheet_name)
         
         return worksheet
         
     except WorksheetNotFound:
+        _worksheet_cache.pop(sheet_name)
         if auto_create:
-            logger.info(f"Worksheet '{sheet_name}' not found. Creating it...")
+            logger.info("Worksheet '%s' not found. Creating it...", sheet_name)
             
             # Use default configuration if available
             if sheet_name in DEFAULT_WORKSHEET_CONFIGS:
@@ -370,14 +674,15 @@ def get_worksheet(sheet_name: str, auto_create: bool = True, ensure_columns: boo
                 # Create with default parameters
                 worksheet = create_worksheet(sheet_name=sheet_name)
             
-            logger.info(f"Successfully created and accessed worksheet: {sheet_name}")
+            _worksheet_cache.set(sheet_name, worksheet)
+            logger.info("Successfully created and accessed worksheet: %s", sheet_name)
             return worksheet
         else:
-            logger.error(f"Worksheet '{sheet_name}' not found and auto_create is disabled")
+            logger.error("Worksheet '%s' not found and auto_create is disabled", sheet_name)
             raise Exception(f"Worksheet '{sheet_name}' not found in spreadsheet")
             
     except Exception as e:
-        logger.error(f"Failed to access worksheet '{sheet_name}': {str(e)}")
+        logger.error("Failed to access worksheet '%s': %s", sheet_name, e)
         raise Exception(f"Failed to access worksheet '{sheet_name}': {str(e)}")
 
 
@@ -395,7 +700,7 @@ def ensure_worksheet_exists(sheet_name: str) -> bool:
         get_worksheet(sheet_name, auto_create=True, ensure_columns=True)
         return True
     except Exception as e:
-        logger.error(f"Failed to ensure worksheet '{sheet_name}' exists: {str(e)}")
+        logger.error("Failed to ensure worksheet '%s' exists: %s", sheet_name, e)
         return False
 
 
@@ -430,21 +735,21 @@ def validate_worksheet_structure(sheet_name: str) -> Dict[str, Any]:
             
             if missing_columns:
                 validation_result['validation_passed'] = False
-                logger.info(f"Attempting to create missing columns in {sheet_name}: {missing_columns}")
+                logger.info("Attempting to create missing columns in %s: %s", sheet_name, missing_columns)
                 
                 # Attempt to create missing columns
                 if ensure_columns_exist(worksheet, REQUIRED_COLUMNS[sheet_name]):
                     validation_result['validation_passed'] = True
                     validation_result['actions_taken'].append(f"Created missing columns: {missing_columns}")
-                    logger.info(f"Successfully created missing columns in {sheet_name}")
+                    logger.info("Successfully created missing columns in %s", sheet_name)
                 else:
                     validation_result['actions_taken'].append(f"Failed to create missing columns: {missing_columns}")
-                    logger.error(f"Failed to create missing columns in {sheet_name}")
+                    logger.error("Failed to create missing columns in %s", sheet_name)
         
         return validation_result
         
     except Exception as e:
-        logger.error(f"Failed to validate worksheet structure for '{sheet_name}': {e}")
+        logger.error("Failed to validate worksheet structure for '%s': %s", sheet_name, e)
         return {
             'worksheet_exists': False,
             'error': str(e),
@@ -462,6 +767,12 @@ def initialize_default_worksheets() -> Dict[str, bool]:
     """
     results = {}
     
+    try:
+        _create_missing_default_worksheets()
+    except Exception as e:
+        # Not fatal: get_worksheet() below creates any missing sheet one by one
+        logger.error("Failed to create default worksheets in one batch: %s", e)
+    
     for sheet_name in DEFAULT_WORKSHEET_CONFIGS.keys():
         try:
             ensure_worksheet_exists(sheet_name)
@@ -470,26 +781,383 @@ def initialize_default_worksheets() -> Dict[str, bool]:
             results[sheet_name] = validation_result['validation_passed']
             
             if validation_result['validation_passed']:
-                logger.info(f"Successfully initialized worksheet: {sheet_name}")
+                logger.info("Successfully initialized worksheet: %s", sheet_name)
                 if validation_result['actions_taken']:
-                    logger.info(f"Actions taken for {sheet_name}: {validation_result['actions_taken']}")
+                    logger.info("Actions taken for %s: %s", sheet_name, validation_result['actions_taken'])
             else:
-                logger.error(f"Failed to properly initialize worksheet '{sheet_name}': {validation_result}")
+                logger.error("Failed to properly initialize worksheet '%s': %s", sheet_name, validation_result)
                 
         except Exception as e:
             results[sheet_name] = False
-            logger.error(f"Failed to initialize worksheet '{sheet_name}': {str(e)}")
+            logger.error("Failed to initialize worksheet '%s': %s", sheet_name, e)
     
     return results
     
+
+def _create_missing_default_worksheets() -> None:
+    """
+    Create every missing sheet of DEFAULT_WORKSHEET_CONFIGS with its headers,
+    using one batchUpdate for all of them instead of two requests per sheet.
+    """
+    spreadsheet = _get_spreadsheet()
+    existing_titles = {worksheet.title for worksheet in _retry_on_rate_limit(spreadsheet.worksheets)()}
+    missing = [name for name in DEFAULT_WORKSHEET_CONFIGS if name not in existing_titles]
+    if not missing:
+        return
+    
+    requests = []
+    for name in missing:
+        sheet_config = DEFAULT_WORKSHEET_CONFIGS[name]
+        requests.extend(_add_sheet_requests(name, sheet_config['rows'], sheet_config['cols'], sheet_config['headers']))
+    
+    response = _retry_on_rate_limit(spreadsheet.batch_update)({'requests': requests})
+    for reply in response['replies']:
+        if 'addSheet' in reply:
+            properties = reply['addSheet']['properties']
+            _worksheet_cache.set(properties['title'], gspread.Worksheet(spreadsheet, properties, spreadsheet.id, spreadsheet.client))
+    
+    # The default headers include every required column
+    _columns_ensured.update(missing)
+    logger.info("Successfully created worksheets with headers: %s", missing)
+
+
 def append_row(sheet_name: str, row_data: List[Any], auto_create: bool = True) -> bool:
     """
-    Append a single row to the specified worksheet.
+    Queue a single row to be appended to the specified worksheet.
+    
+    The row is written by a background thread, batched with other queued rows
+    for the same sheet into one API call. Reads and other writes through this
+    module flush the sheet's queued rows first, so they always see them.
     
     Args:
         sheet_name (str): Name of the worksheet
         row_data (List[Any]): List of values to append as a new row
         auto_create (bool): Whether to create the worksheet if it doesn't exist
+    
+    Returns:
+        bool: True once the row is queued
+    """
+    # Normalize values for the API (numbers stay numbers, the rest become strings)
+    formatted_row = list(map(_normalize_cell, row_data))
+    
+    # Queued rows are always written with auto_create, so write directly otherwise
+    if not auto_create:
+        _flush_pending(sheet_name)
+        return _append_rows_now(sheet_name, [formatted_row], auto_create=False)
+    
+    with _pending_lock:
+        rows = _pending_rows.setdefault(sheet_name, [])
+        rows.append(formatted_row)
+        pending_count = len(rows)
+        _start_writer()
+    
+    if pending_count >= APPEND_FLUSH_ROWS:
+        _pending_event.set()
+    
+    logger.debug("Queued row for '%s': %d columns", sheet_name, len(formatted_row))
+    return True
+
+
+def _start_writer() -> None:
+    """Start the background writer thread on first use. Called with _pending_lock held."""
+    global _writer_thread
+    
+    if _writer_thread is None:
+        _writer_thread = threading.Thread(target=_writer_loop, name='sheets-writer', daemon=True)
+        _writer_thread.start()
+        atexit.register(_flush_at_exit)
+
+
+def _writer_loop() -> None:
+    """Flush queued rows every APPEND_FLUSH_INTERVAL seconds, or when woken early."""
+    while True:
+        _pending_event.wait(APPEND_FLUSH_INTERVAL)
+        _pending_event.clear()
+        try:
+            flush_pending_rows()
+        except Exception as e:
+            logger.error("Background flush of queued rows failed, will retry: %s", e)
+
+
+def _flush_at_exit() -> None:
+    """Write any rows still queued when the process exits."""
+    try:
+        flush_pending_rows(force=True)
+    except Exception as e:
+        logger.error("Queued rows were lost at exit: %s", e)
+
+
+def flush_pending_rows(sheet_name: Optional[str] = None, force: bool = False) -> None:
+    """
+    Write queued rows now, one append_rows call per sheet.
+    
+    Rows that fail to write are put back at the front of the queue so a later
+    flush retries them in order. Sheets still backing off from a failed flush
+    are skipped unless force is set; after APPEND_MAX_FAILED_FLUSHES failures
+    in a row a sheet's rows are parked until it can be written again, and rows
+    the API rejects are set aside (see _parked_rows and _rejected_rows).
+    
+    Args:
+        sheet_name (str, optional): Only flush this sheet. Defaults to every sheet.
+        force (bool): Also flush sheets that are backing off and retry parked and
+                      rejected rows, e.g. at shutdown
+    
+    Raises:
+        Exception: If any sheet's rows could not be written
+    """
+    with _flush_lock:
+        now = time.monotonic()
+        with _pending_lock:
+            # Parked rows whose retry is due (or all of them, and rejected rows,
+            # when forced) go back to the front of the queue
+            for name in [name for name in _parked_rows if sheet_name is None or name == sheet_name]:
+                if force or _retry_at.get(name, 0) <= now:
+                    _pending_rows[name] = _parked_rows.pop(name) + _pending_rows.get(name, [])
+                    if not force:
+                        # One more failure parks them again straight away
+                        _failed_flushes[name] = APPEND_MAX_FAILED_FLUSHES - 1
+            if force:
+                for name in [name for name in _rejected_rows if sheet_name is None or name == sheet_name]:
+                    _pending_rows[name] = _rejected_rows.pop(name) + _pending_rows.get(name, [])
+            
+            names = list(_pending_rows) if sheet_name is None else [sheet_name]
+            batches = {}
+            for name in names:
+                if not force and _retry_at.get(name, 0) > now:
+                    continue
+                rows = _pending_rows.pop(name, None)
+                if rows:
+                    batches[name] = rows
+        
+        errors = []
+        for name, rows in batches.items():
+            try:
+                _append_rows_now(name, rows)
+                _handle_successful_flush(name)
+            except Exception as e:
+                errors.append(str(e))
+                if _rejected_by_api(e):
+                    rows = _split_rejected_rows(name, rows)
+                if rows:
+                    _handle_failed_flush(name, rows)
+        
+        if errors:
+            raise Exception(f"Failed to flush queued rows: {'; '.join(errors)}")
+
+
+def _rejected_by_api(error: BaseException) -> bool:
+    """Check whether an error, or the APIError it wraps, is an HTTP 400: the request itself was refused."""
+    while error is not None:
+        if isinstance(error, APIError):
+            return error.response.status_code == 400
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def _split_rejected_rows(sheet_name: str, rows: List[List[Any]]) -> List[List[Any]]:
+    """
+    Write a refused batch one row at a time, so only the rows the API rejects
+    are set aside. Stops at the first failure that isn't a rejection.
+    
+    Returns:
+        List[List[Any]]: The rows still to retry, in order
+    """
+    if len(rows) == 1:
+        _reject_rows(sheet_name, rows)
+        return []
+    
+    for index, row in enumerate(rows):
+        try:
+            _append_rows_now(sheet_name, [row])
+        except Exception as e:
+            if not _rejected_by_api(e):
+                return rows[index:]
+            _reject_rows(sheet_name, [row])
+    
+    _handle_successful_flush(sheet_name)
+    return []
+
+
+def _reject_rows(sheet_name: str, rows: List[List[Any]]) -> None:
+    """Set aside rows the API refused, logging them in full."""
+    _rejected_rows.setdefault(sheet_name, []).extend(rows)
+    logger.error("Sheets API rejected %d queued rows for '%s', set aside until shutdown: %s", len(rows), sheet_name, rows)
+
+
+def _handle_successful_flush(sheet_name: str) -> None:
+    """Reset a sheet's backoff, and queue its parked rows again now that it can be written."""
+    _failed_flushes.pop(sheet_name, None)
+    _retry_at.pop(sheet_name, None)
+    
+    parked = _parked_rows.pop(sheet_name, None)
+    if parked:
+        with _pending_lock:
+            _pending_rows[sheet_name] = parked + _pending_rows.get(sheet_name, [])
+        _pending_event.set()
+        logger.info("Requeued %d parked rows for '%s'", len(parked), sheet_name)
+
+
+def _handle_failed_flush(sheet_name: str, rows: List[List[Any]]) -> None:
+    """Requeue a sheet's rows with backoff after a failed flush, or park them once it failed too often."""
+    failures = _failed_flushes.get(sheet_name, 0) + 1
+    if failures >= APPEND_MAX_FAILED_FLUSHES:
+        _failed_flushes.pop(sheet_name, None)
+        _retry_at[sheet_name] = time.monotonic() + APPEND_PARKED_RETRY_INTERVAL
+        _parked_rows.setdefault(sheet_name, []).extend(rows)
+        logger.error("Parking %d queued rows for '%s' after %d failed flushes until it can be written again: %s", len(rows), sheet_name, failures, rows)
+        return
+    
+    delay = min(APPEND_FLUSH_INTERVAL * 2 ** failures, APPEND_RETRY_MAX_DELAY)
+    _failed_flushes[sheet_name] = failures
+    _retry_at[sheet_name] = time.monotonic() + delay
+    with _pending_lock:
+        _pending_rows[sheet_name] = rows + _pending_rows.get(sheet_name, [])
+    logger.warning("Flushing %d queued rows for '%s' failed (%d/%d), retrying in %.1fs", len(rows), sheet_name, failures, APPEND_MAX_FAILED_FLUSHES, delay)
+
+
+def _invalidate_reads(sheet_name: str) -> None:
+    """Drop cached reads of a sheet after writing to it."""
+    _read_cache.pop((sheet_name, 'records'))
+    _read_cache.pop((sheet_name, 'values'))
+    _read_snapshots.pop(sheet_name)
+
+
+def _flush_pending(sheet_name: str, for_read: bool = False) -> None:
+    """
+    Write a sheet's queued rows and buffered updates, if any, before touching the sheet.
+    
+    For reads, a failed row flush is only logged: the rows stay queued for the
+    background writer and the read goes ahead without them.
+    """
+    if sheet_name in _pending_rows:
+        try:
+            flush_pending_rows(sheet_name)
+        except Exception as e:
+            if not for_read:
+                raise
+            logger.warning("Reading '%s' without its queued rows, which failed to write: %s", sheet_name, e)
+    
+    buffer = _update_buffer.get()
+    if buffer and sheet_name in buffer:
+        _send_updates({sheet_name: buffer.pop(sheet_name)})
+
+
+@contextmanager
+def coalesced_updates():
+    """
+    Buffer update_range() and batch_update() calls made in this context and send
+    them on exit with one values.batchUpdate request, whichever sheets they
+    touch. Consecutive updates of vertically adjacent ranges with the same
+    columns (e.g. A5:C5 then A6:C6) are merged into one range first.
+    
+    Any other read or write of a sheet inside the block first sends that sheet's
+    buffered updates, so operations still happen in order. Nested blocks join
+    the outermost one.
+    
+    Raises:
+        Exception: If sending the buffered updates fails
+    """
+    if _update_buffer.get() is not None:
+        yield
+        return
+    
+    buffer = {}
+    token = _update_buffer.set(buffer)
+    try:
+        yield
+    finally:
+        _update_buffer.reset(token)
+        if buffer:
+            _send_updates(buffer)
+
+
+def _send_updates(updates_by_sheet: Dict[str, List[Dict[str, Any]]]) -> None:
+    """
+    Send buffered updates for any number of sheets in one values.batchUpdate request.
+    
+    Raises:
+        Exception: If the update fails
+    """
+    sheet_names = list(updates_by_sheet)
+    try:
+        data = []
+        for sheet_name, updates in updates_by_sheet.items():
+            worksheet = get_worksheet(sheet_name, ensure_columns=True)
+            data.extend(
+                {
+                    'range': absolute_range_name(worksheet.title, update['range']),
+                    'values': _format_values(update['values'])
+                }
+                for update in _merge_adjacent_updates(updates)
+            )
+        
+        _retry_on_rate_limit(_get_spreadsheet().values_batch_update, idempotent=True)({'valueInputOption': 'RAW', 'data': data})
+        for sheet_name in sheet_names:
+            _invalidate_reads(sheet_name)
+        logger.info("Successfully sent %d buffered updates to %s", len(data), sheet_names)
+        
+    except APIError as e:
+        logger.error("API error when sending buffered updates to %s: %s", sheet_names, e)
+        raise Exception(f"Failed to perform batch update due to API error: {str(e)}")
+    except Exception as e:
+        logger.error("Failed to send buffered updates to %s: %s", sheet_names, e)
+        raise Exception(f"Failed to perform batch update: {str(e)}")
+
+
+def _merge_adjacent_updates(updates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Merge each update into the previous one when it continues it directly below.
+    
+    Only fully bounded ranges (like 'A5:C6') whose values fill them exactly are
+    merged, and only with the update right before them, so the order in which
+    overlapping updates apply never changes.
+    """
+    merged = []
+    previous_grid = None
+    for update in updates:
+        grid = _bounded_grid(update)
+        if (grid is not None and previous_grid is not None
+                and grid['startRowIndex'] == previous_grid['endRowIndex']
+                and grid['startColumnIndex'] == previous_grid['startColumnIndex']
+                and grid['endColumnIndex'] == previous_grid['endColumnIndex']):
+            previous = merged[-1]
+            previous_grid['endRowIndex'] = grid['endRowIndex']
+            previous['values'] = previous['values'] + update['values']
+            previous['range'] = (
+                rowcol_to_a1(previous_grid['startRowIndex'] + 1, previous_grid['startColumnIndex'] + 1) + ':'
+                + rowcol_to_a1(previous_grid['endRowIndex'], previous_grid['endColumnIndex'])
+            )
+            continue
+        
+        merged.append(dict(update))
+        previous_grid = grid
+    return merged
+
+
+def _bounded_grid(update: Dict[str, Any]) -> Optional[Dict[str, int]]:
+    """Get an update's grid range if it is fully bounded and its values fill it exactly, else None."""
+    range_name = update['range']
+    if '!' in range_name:
+        return None
+    
+    try:
+        grid = a1_range_to_grid_range(range_name)
+    except Exception:
+        return None
+    
+    if len(grid) != 4 or len(update['values']) != grid['endRowIndex'] - grid['startRowIndex']:
+        return None
+    return grid
+
+
+def append_rows(sheet_name: str, rows: List[List[Any]], auto_create: bool = True) -> bool:
+    """
+    Append several rows to the specified worksheet in a single API call.
+    
+    Args:
+        sheet_name (str): Name of the worksheet
+        rows (List[List[Any]]): Rows to append, each a list of values
+        auto_create (bool): Whether to create the worksheet if it doesn't exist
         
     Returns:
         bool: True if successful, False otherwise
@@ -497,28 +1165,48 @@ def append_row(sheet_name: str, row_data: List[Any], auto_create: bool = True) -
     Raises:
         Exception: If append operation fails
     """
+    if not rows:
+        return True
+    
+    # Keep the sheet's row order: anything queued by append_row() goes first
+    _flush_pending(sheet_name)
+    
+    # Normalize values for the API (numbers stay numbers, the rest become strings)
+    formatted_rows = _format_values(rows)
+    
+    return _append_rows_now(sheet_name, formatted_rows, auto_create=auto_create)
+
+
+def _append_rows_now(sheet_name: str, formatted_rows: List[List[Any]], auto_create: bool = True) -> bool:
+    """Append already-formatted rows in one API call, without touching the queue."""
     try:
         worksheet = get_worksheet(sheet_name, auto_create=auto_create, ensure_columns=True)
         
-        # Convert all values to strings to ensure compatibility
-        formatted_row = [str(value) if value is not None else "" for value in row_data]
-        
-        worksheet.append_row(formatted_row)
-        logger.info(f"Successfully appended row to '{sheet_name}': {len(formatted_row)} columns")
+        # One values.append request; INSERT_ROWS adds new rows below the data
+        # instead of overwriting whatever comes after the detected table, and
+        # RAW stores text as typed instead of parsing it (e.g. as formulas)
+        _retry_on_rate_limit(worksheet.append_rows)(
+            formatted_rows, value_input_option='RAW', insert_data_option='INSERT_ROWS'
+        )
+        _invalidate_reads(sheet_name)
+        logger.info("Successfully appended %d rows to '%s'", len(formatted_rows), sheet_name)
         return True
         
     except APIError as e:
-        logger.error(f"API error when appending row to '{sheet_name}': {str(e)}")
-        raise Exception(f"Failed to append row due to API error: {str(e)}")
+        logger.error("API error when appending rows to '%s': %s", sheet_name, e)
+        raise Exception(f"Failed to append rows due to API error: {str(e)}")
     except Exception as e:
-        logger.error(f"Failed to append row to '{sheet_name}': {str(e)}")
-        raise Exception(f"Failed to append row to worksheet: {str(e)}")
+        logger.error("Failed to append rows to '%s': %s", sheet_name, e)
+        raise Exception(f"Failed to append rows to worksheet: {str(e)}")
 
 
 def get_all_records(sheet_name: str, auto_create: bool = True) -> List[Dict[str, Any]]:
     """
     Get all records from a worksheet as a list of dictionaries.
     
+    Results are cached for READ_CACHE_TTL seconds; each call gets its own copy
+    of the rows, so callers can modify them freely.
+    
     Args:
         sheet_name (str): Name of the worksheet
         auto_create (bool): Whether to create the worksheet if it doesn't exist
@@ -531,18 +1219,23 @@ def get_all_records(sheet_name: str, auto_create: bool = True) -> List[Dict[str,
         Exception: If reading operation fails
     """
     try:
-        worksheet = get_worksheet(sheet_name, auto_create=auto_create, ensure_columns=True)
+        _flush_pending(sheet_name, for_read=True)
         
-        # Get all records as dictionaries
-        records = worksheet.get_all_records()
-        logger.info(f"Successfully retrieved {len(records)} records from '{sheet_name}'")
-        return records
+        cache_key = (sheet_name, 'records')
+        records = _read_cache.get(cache_key)
+        if records is None:
+            # Built from the (cached) raw values, so reading both costs one API call
+            records = list(_iter_records(_get_values(sheet_name, auto_create)))
+            _read_cache.set(cache_key, records)
+            logger.info("Successfully retrieved %d records from '%s'", len(records), sheet_name)
+        
+        return [dict(record) for record in records]
         
     except APIError as e:
-        logger.error(f"API error when reading '{sheet_name}': {str(e)}")
+        logger.error("API error when reading '%s': %s", sheet_name, e)
         raise Exception(f"Failed to read records due to API error: {str(e)}")
     except Exception as e:
-        logger.error(f"Failed to read records from '{sheet_name}': {str(e)}")
+        logger.error("Failed to read records from '%s': %s", sheet_name, e)
         raise Exception(f"Failed to read records from worksheet: {str(e)}")
 
 
@@ -550,6 +1243,9 @@ def get_all_values(sheet_name: str, auto_create: bool = True) -> List[List[str]]
     """
     Get all values from a worksheet as a list of lists.
     
+    Results are cached for READ_CACHE_TTL seconds; each call gets its own copy
+    of the rows, so callers can modify them freely.
+    
     Args:
         sheet_name (str): Name of the worksheet
         auto_create (bool): Whether to create the worksheet if it doesn't exist
@@ -561,21 +1257,274 @@ def get_all_values(sheet_name: str, auto_create: bool = True) -> List[List[str]]
         Exception: If reading operation fails
     """
     try:
-        worksheet = get_worksheet(sheet_name, auto_create=auto_create, ensure_columns=True)
+        _flush_pending(sheet_name, for_read=True)
         
-        # Get all values including headers
-        values = worksheet.get_all_values()
-        logger.info(f"Successfully retrieved {len(values)} rows from '{sheet_name}'")
-        return values
+        values = _get_values(sheet_name, auto_create)
+        return [list(row) for row in values]
         
     except APIError as e:
-        logger.error(f"API error when reading values from '{sheet_name}': {str(e)}")
+        logger.error("API error when reading values from '%s': %s", sheet_name, e)
         raise Exception(f"Failed to read values due to API error: {str(e)}")
     except Exception as e:
-        logger.error(f"Failed to read values from '{sheet_name}': {str(e)}")
+        logger.error("Failed to read values from '%s': %s", sheet_name, e)
         raise Exception(f"Failed to read values from worksheet: {str(e)}")
 
 
+def get_all_values_multi(sheet_names: List[str], auto_create: bool = True) -> Dict[str, List[List[str]]]:
+    """
+    Get all values from several worksheets with a single values.batchGet request.
+    
+    Sheets already in the read cache are served from it; only the rest are
+    fetched, and they are cached like get_all_values() results.
+    
+    Args:
+        sheet_names (List[str]): Names of the worksheets
+        auto_create (bool): Whether to create worksheets that don't exist
+    
+    Returns:
+        Dict[str, List[List[str]]]: All values of each worksheet, including headers
+    
+    Raises:
+        Exception: If reading operation fails
+    """
+    try:
+        results = {}
+        missing = []
+        for sheet_name in sheet_names:
+            _flush_pending(sheet_name, for_read=True)
+            
+            values = _read_cache.get((sheet_name, 'values'))
+            if values is None:
+                missing.append(sheet_name)
+            else:
+                results[sheet_name] = values
+        
+        if missing:
+            # Make sure every sheet exists before asking for its values
+            titles = [get_worksheet(name, auto_create=auto_create, ensure_columns=True).title for name in missing]
+            response = _retry_on_rate_limit(_get_spreadsheet().values_batch_get)(
+                [absolute_range_name(title) for title in titles],
+                params={'majorDimension': 'ROWS'}
+            )
+            
+            # Pad ragged rows the same way worksheet.get_all_values() does
+            for sheet_name, value_range in zip(missing, response.get('valueRanges', [])):
+                values = fill_gaps(value_range.get('values', [[]]))
+                _read_cache.set((sheet_name, 'values'), values)
+                results[sheet_name] = values
+            
+            logger.info("Successfully retrieved values from %d worksheets in one request: %s", len(missing), missing)
+        
+        return {name: [list(row) for row in results[name]] for name in sheet_names}
+    
+    except APIError as e:
+        logger.error("API error when reading values from %s: %s", sheet_names, e)
+        raise Exception(f"Failed to read values due to API error: {str(e)}")
+    except Exception as e:
+        logger.error("Failed to read values from %s: %s", sheet_names, e)
+        raise Exception(f"Failed to read values from worksheets: {str(e)}")
+
+
+def get_all_records_multi(sheet_names: List[str], auto_create: bool = True) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Get all records from several worksheets, fetching the uncached ones with a
+    single values.batchGet request (see get_all_values_multi()).
+    
+    Args:
+        sheet_names (List[str]): Names of the worksheets
+        auto_create (bool): Whether to create worksheets that don't exist
+        
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: Records of each worksheet, with column headers as keys
+        
+    Raises:
+        Exception: If reading operation fails
+    """
+    try:
+        results = {}
+        missing = []
+        for sheet_name in sheet_names:
+            _flush_pending(sheet_name, for_read=True)
+            
+            records = _read_cache.get((sheet_name, 'records'))
+            if records is None:
+                missing.append(sheet_name)
+            else:
+                results[sheet_name] = records
+        
+        if missing:
+            for sheet_name, values in get_all_values_multi(missing, auto_create=auto_create).items():
+                records = list(_iter_records(values))
+                _read_cache.set((sheet_name, 'records'), records)
+                results[sheet_name] = records
+        
+        return {name: [dict(record) for record in results[name]] for name in sheet_names}
+        
+    except APIError as e:
+        logger.error("API error when reading records from %s: %s", sheet_names, e)
+        raise Exception(f"Failed to read records due to API error: {str(e)}")
+    except Exception as e:
+        logger.error("Failed to read records from %s: %s", sheet_names, e)
+        raise Exception(f"Failed to read records from worksheets: {str(e)}")
+
+
+def _get_values(sheet_name: str, auto_create: bool = True) -> List[List[str]]:
+    """
+    Get a sheet's raw values from the read cache, fetching them on a miss.
+    
+    On a miss the sheet's snapshot is reused instead if the spreadsheet's
+    revision hasn't changed since it was taken.
+    
+    The returned rows are shared with the cache and must not be modified.
+    Queued writes must already be flushed.
+    """
+    cache_key = (sheet_name, 'values')
+    values = _read_cache.get(cache_key)
+    if values is None:
+        # The revision is only asked for when there is a snapshot to check.
+        # Without one (first read, or right after a local write dropped it) the
+        # values are fetched and kept as a snapshot of unknown revision; the
+        # next miss records its revision, and later misses can reuse it. The
+        # revision is read before the values, so a change made in between shows
+        # up as a newer revision next time instead of being missed.
+        snapshot = _read_snapshots.get(sheet_name)
+        revision = _get_revision() if snapshot is not None else None
+        if revision is not None and snapshot[0] == revision:
+            values = snapshot[1]
+            logger.debug("Spreadsheet unchanged, reusing snapshot of '%s'", sheet_name)
+        else:
+            worksheet = get_worksheet(sheet_name, auto_create=auto_create, ensure_columns=True)
+            
+            # Get all values including headers
+            values = _retry_on_rate_limit(worksheet.get_all_values)()
+            _read_snapshots.set(sheet_name, (revision, values))
+            logger.info("Successfully retrieved %d rows from '%s'", len(values), sheet_name)
+        
+        _read_cache.set(cache_key, values)
+    
+    return values
+
+
+def _get_revision() -> Optional[str]:
+    """
+    Get the spreadsheet's Drive modifiedTime, or None if the Drive API can't be used.
+    """
+    global _revision_unavailable
+    
+    if _revision_unavailable:
+        return None
+    
+    try:
+        return _retry_on_rate_limit(_get_spreadsheet().get_lastUpdateTime)()
+    except APIError as e:
+        if e.response.status_code in (403, 404):
+            # The Drive API isn't enabled or the file isn't visible to it; don't keep trying
+            _revision_unavailable = True
+            logger.warning("Drive revision check unavailable, sheets will be re-read in full: %s", e)
+        else:
+            logger.warning("Failed to get spreadsheet revision: %s", e)
+    except Exception as e:
+        logger.warning("Failed to get spreadsheet revision: %s", e)
+    return None
+
+
+# gspread's numericise() memoized: it tries int() and float() and catches their
+# ValueErrors for every text cell, while most cells repeat (types, categories,
+# currency) across rows
+_numericise = functools.lru_cache(maxsize=4096)(numericise)
+
+
+def _iter_records(values: List[List[str]]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield one record per data row, keyed by the header row.
+    
+    Numbers are converted the same way gspread's get_all_records() does;
+    empty cells, the most common kind, stay "" without being looked at.
+    """
+    if not values or values == [[]]:
+        return
+    
+    headers = values[0]
+    for row in values[1:]:
+        yield dict(zip(headers, [_numericise(cell) if cell else cell for cell in row]))
+
+
+def iter_records(sheet_name: str, auto_create: bool = True) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over a worksheet's records one dictionary at a time.
+    
+    Unlike get_all_records(), no list of every record is built, so a scan that
+    stops early only pays for the rows it looked at.
+    
+    Args:
+        sheet_name (str): Name of the worksheet
+        auto_create (bool): Whether to create the worksheet if it doesn't exist
+    
+    Yields:
+        Dict[str, Any]: One record per data row, with column headers as keys
+    
+    Raises:
+        Exception: If reading operation fails
+    """
+    try:
+        _flush_pending(sheet_name, for_read=True)
+        values = _get_values(sheet_name, auto_create)
+    
+    except APIError as e:
+        logger.error("API error when reading '%s': %s", sheet_name, e)
+        raise Exception(f"Failed to read records due to API error: {str(e)}")
+    except Exception as e:
+        logger.error("Failed to read records from '%s': %s", sheet_name, e)
+        raise Exception(f"Failed to read records from worksheet: {str(e)}")
+    
+    yield from _iter_records(values)
+
+
+def _get_io_executor() -> ThreadPoolExecutor:
+    """Get the shared Sheets read thread pool, creating it on first use."""
+    global _io_executor
+    
+    if _io_executor is None:
+        with _io_executor_lock:
+            if _io_executor is None:
+                _io_executor = ThreadPoolExecutor(
+                    max_workers=SHEETS_IO_MAX_WORKERS,
+                    thread_name_prefix='sheets-io'
+                )
+    return _io_executor
+
+
+def get_all_records_async(sheet_name: str, auto_create: bool = True) -> "Future[List[Dict[str, Any]]]":
+    """
+    Start get_all_records() on the Sheets I/O pool without waiting for it.
+    
+    Several reads can be started and then awaited together, so they cost about
+    one round trip instead of one each.
+    
+    Args:
+        sheet_name (str): Name of the worksheet
+        auto_create (bool): Whether to create the worksheet if it doesn't exist
+    
+    Returns:
+        Future[List[Dict]]: Resolves to the result of get_all_records()
+    """
+    return _get_io_executor().submit(get_all_records, sheet_name, auto_create)
+
+
+def get_all_values_async(sheet_name: str, auto_create: bool = True) -> "Future[List[List[str]]]":
+    """
+    Start get_all_values() on the Sheets I/O pool without waiting for it.
+    
+    Args:
+        sheet_name (str): Name of the worksheet
+        auto_create (bool): Whether to create the worksheet if it doesn't exist
+    
+    Returns:
+        Future[List[List[str]]]: Resolves to the result of get_all_values()
+    """
+    return _get_io_executor().submit(get_all_values, sheet_name, auto_create)
+
+
 def clear_worksheet(sheet_name: str, auto_create: bool = True, preserve_headers: bool = True) -> bool:
     """
     Clear all content from a worksheet.
@@ -584,39 +1533,62 @@ def clear_worksheet(sheet_name: str, auto_create: bool = True, preserve_headers:
         sheet_name (str): Name of the worksheet to clear
         auto_create (bool): Whether to create the worksheet if it doesn't exist
         preserve_headers (bool): Whether to preserve the header row
-        
+    
     Returns:
         bool: True if successful, False otherwise
-        
+    
+    Raises:
+        Exception: If clear operation fails
+    """
+    return clear_worksheets([sheet_name], auto_create=auto_create, preserve_headers=preserve_headers)
+
+
+def clear_worksheets(sheet_names: List[str], auto_create: bool = True, preserve_headers: bool = True) -> bool:
+    """
+    Clear the content of several worksheets with a single batchClear request.
+    
+    Only values are cleared; formatting is kept. With preserve_headers the
+    header row is simply left out of the cleared range, so it is never
+    read or rewritten.
+    
+    Args:
+        sheet_names (List[str]): Names of the worksheets to clear
+        auto_create (bool): Whether to create worksheets that don't exist
+        preserve_headers (bool): Whether to preserve each header row
+    
+    Returns:
+        bool: True if successful, False otherwise
+    
     Raises:
         Exception: If clear operation fails
     """
     try:
-        worksheet = get_worksheet(sheet_name, auto_create=auto_create, ensure_columns=True)
-        
-        if preserve_headers:
-            # Get the headers first
-            headers = worksheet.row_values(1)
-            # Clear all content
-            worksheet.clear()
-            # Restore headers if they existed
-            if headers:
-                worksheet.update('1:1', [headers])
-                logger.info(f"Successfully cleared worksheet '{sheet_name}' while preserving headers")
+        ranges = []
+        for sheet_name in sheet_names:
+            _flush_pending(sheet_name)
+            
+            worksheet = get_worksheet(sheet_name, auto_create=auto_create, ensure_columns=True)
+            if preserve_headers:
+                last_column = rowcol_to_a1(1, worksheet.col_count)[:-1]
+                ranges.append(absolute_range_name(worksheet.title, f"A2:{last_column}"))
             else:
-                logger.info(f"Successfully cleared worksheet: '{sheet_name}' (no headers to preserve)")
-        else:
-            # Clear all content
-            worksheet.clear()
-            logger.info(f"Successfully cleared worksheet: '{sheet_name}'")
+                ranges.append(absolute_range_name(worksheet.title))
         
-        return True
+        if not ranges:
+            return True
         
+        _retry_on_rate_limit(_get_spreadsheet().values_batch_clear, idempotent=True)(body={'ranges': ranges})
+        for sheet_name in sheet_names:
+            _invalidate_reads(sheet_name)
+        
+        logger.info("Successfully cleared worksheets: %s (headers preserved: %s)", sheet_names, preserve_headers)
+        return True
+    
     except APIError as e:
-        logger.error(f"API error when clearing '{sheet_name}': {str(e)}")
+        logger.error("API error when clearing %s: %s", sheet_names, e)
         raise Exception(f"Failed to clear worksheet due to API error: {str(e)}")
     except Exception as e:
-        logger.error(f"Failed to clear worksheet '{sheet_name}': {str(e)}")
+        logger.error("Failed to clear worksheets %s: %s", sheet_names, e)
         raise Exception(f"Failed to clear worksheet: {str(e)}")
 
 
@@ -624,6 +1596,9 @@ def update_range(sheet_name: str, range_name: str, values: List[List[Any]], auto
     """
     Update a specific range in the worksheet with new values.
     
+    Inside coalesced_updates() the update is buffered and sent with the others
+    when the block exits.
+    
     Args:
         sheet_name (str): Name of the worksheet
         range_name (str): Range to update (e.g., 'A1:C3')
@@ -636,24 +1611,29 @@ def update_range(sheet_name: str, range_name: str, values: List[List[Any]], auto
     Raises:
         Exception: If update operation fails
     """
+    buffer = _update_buffer.get()
+    if buffer is not None:
+        buffer.setdefault(sheet_name, []).append({'range': range_name, 'values': values})
+        return True
+    
     try:
+        _flush_pending(sheet_name)
+        
         worksheet = get_worksheet(sheet_name, auto_create=auto_create, ensure_columns=True)
         
-        # Convert all values to strings
-        formatted_values = [
-            [str(cell) if cell is not None else "" for cell in row]
-            for row in values
-        ]
+        # Normalize values for the API (numbers stay numbers, the rest become strings)
+        formatted_values = _format_values(values)
         
-        worksheet.update(range_name, formatted_values)
-        logger.info(f"Successfully updated range '{range_name}' in '{sheet_name}'")
+        _retry_on_rate_limit(worksheet.update)(range_name, formatted_values)
+        _invalidate_reads(sheet_name)
+        logger.info("Successfully updated range '%s' in '%s'", range_name, sheet_name)
         return True
         
     except APIError as e:
-        logger.error(f"API error when updating range in '{sheet_name}': {str(e)}")
+        logger.error("API error when updating range in '%s': %s", sheet_name, e)
         raise Exception(f"Failed to update range due to API error: {str(e)}")
     except Exception as e:
-        logger.error(f"Failed to update range in '{sheet_name}': {str(e)}")
+        logger.error("Failed to update range in '%s': %s", sheet_name, e)
         raise Exception(f"Failed to update range in worksheet: {str(e)}")
 
 
@@ -661,6 +1641,9 @@ def batch_update(sheet_name: str, updates: List[Dict[str, Any]], auto_create: bo
     """
     Perform multiple updates to a worksheet in a single API call.
     
+    Inside coalesced_updates() the updates are buffered and sent with the others
+    when the block exits.
+    
     Args:
         sheet_name (str): Name of the worksheet
         updates (List[Dict[str, Any]]): List of update operations
@@ -673,30 +1656,32 @@ def batch_update(sheet_name: str, updates: List[Dict[str, Any]], auto_create: bo
     Raises:
         Exception: If batch update operation fails
     """
+    buffer = _update_buffer.get()
+    if buffer is not None:
+        buffer.setdefault(sheet_name, []).extend(updates)
+        return True
+    
     try:
+        _flush_pending(sheet_name)
+        
         worksheet = get_worksheet(sheet_name, auto_create=auto_create, ensure_columns=True)
         
         # Format updates for batch operation
-        formatted_updates = []
-        for update in updates:
-            formatted_values = [
-                [str(cell) if cell is not None else "" for cell in row]
-                for row in update['values']
-            ]
-            formatted_updates.append({
-                'range': update['range'],
-                'values': formatted_values
-            })
+        formatted_updates = [
+            {'range': update['range'], 'values': _format_values(update['values'])}
+            for update in updates
+        ]
         
-        worksheet.batch_update(formatted_updates)
-        logger.info(f"Successfully performed {len(updates)} batch updates to '{sheet_name}'")
+        _retry_on_rate_limit(worksheet.batch_update, idempotent=True)(formatted_updates)
+        _invalidate_reads(sheet_name)
+        logger.info("Successfully performed %d batch updates to '%s'", len(updates), sheet_name)
         return True
         
     except APIError as e:
-        logger.error(f"API error during batch update to '{sheet_name}': {str(e)}")
+        logger.error("API error during batch update to '%s': %s", sheet_name, e)
         raise Exception(f"Failed to perform batch update due to API error: {str(e)}")
     except Exception as e:
-        logger.error(f"Failed to perform batch update to '{sheet_name}': {str(e)}")
+        logger.error("Failed to perform batch update to '%s': %s", sheet_name, e)
         raise Exception(f"Failed to perform batch update: {str(e)}")
 
 
@@ -729,11 +1714,44 @@ def get_worksheet_info(sheet_name: str, auto_create: bool = True) -> Dict[str, A
         validation_result = validate_worksheet_structure(sheet_name)
         info['validation'] = validation_result
         
-        logger.debug(f"Retrieved info for worksheet '{sheet_name}': {info}")
+        logger.debug("Retrieved info for worksheet '%s': %s", sheet_name, info)
         return info
         
     except Exception as e:
-        logger.error(f"Failed to get info for worksheet '{sheet_name}': {str(e)}")
+        logger.error("Failed to get info for worksheet '%s': %s", sheet_name, e)
+        raise Exception(f"Failed to get worksheet information: {str(e)}")
+
+
+def get_all_worksheet_info() -> List[Dict[str, Any]]:
+    """
+    Get basic information about every worksheet with a single metadata request.
+    
+    Returns:
+        List[Dict[str, Any]]: One dictionary per worksheet with its title,
+                              row_count, col_count and id, in tab order
+    
+    Raises:
+        Exception: If operation fails
+    """
+    try:
+        metadata = _retry_on_rate_limit(_get_spreadsheet().fetch_sheet_metadata)()
+        
+        info = []
+        for sheet in metadata.get('sheets', []):
+            properties = sheet['properties']
+            grid = properties.get('gridProperties', {})
+            info.append({
+                'title': properties['title'],
+                'row_count': grid.get('rowCount', 0),
+                'col_count': grid.get('columnCount', 0),
+                'id': properties['sheetId']
+            })
+        
+        logger.debug("Retrieved info for %d worksheets", len(info))
+        return info
+    
+    except Exception as e:
+        logger.error("Failed to get worksheet information: %s", e)
         raise Exception(f"Failed to get worksheet information: {str(e)}")
 
 
@@ -742,10 +1760,17 @@ def reset_connection():
     """
     Reset the global connection variables.
     Useful for testing or when authentication needs to be refreshed.
+    The loaded service account credentials are kept and reused.
     """
-    global _gc, _spreadsheet
-    _gc = None
-    _spreadsheet = None
+    global _gc, _spreadsheet, _revision_unavailable
+    with _init_lock:
+        _gc = None
+        _spreadsheet = None
+    _revision_unavailable = False
+    _worksheet_cache.clear()
+    _columns_ensured.clear()
+    _read_cache.clear()
+    _read_snapshots.clear()
     logger.info("Reset Google Sheets API connection")
 
 
@@ -760,7 +1785,7 @@ def test_connection() -> bool:
         spreadsheet = _get_spreadsheet()
         # Try to get basic spreadsheet info
         title = spreadsheet.title
-        logger.info(f"Google Sheets API connection test successful for: {title}")
+        logger.info("Google Sheets API connection test successful for: %s", title)
         
         # Initialize default worksheets
         logger.info("Initializing default worksheets...")
@@ -769,10 +1794,10 @@ def test_connection() -> bool:
         success_count = sum(1 for success in results.values() if success)
         total_count = len(results)
         
-        logger.info(f"Worksheet initialization complete: {success_count}/{total_count} successful")
+        logger.info("Worksheet initialization complete: %s/%s successful", success_count, total_count)
         
         return True
         
     except Exception as e:
-        logger.error(f"Google Sheets API connection test failed: {str(e)}")
+        logger.error("Google Sheets API connection test failed: %s", e)
         return False
\ No newline at end of file
@@ -10,9 +10,11 @@ It should be called exclusively by the messenger.handler module.
 """
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, date
-from typing import List, Dict, Any, Optional
-import pandas as pd
+from typing import List, Dict, Any, Optional, Union, TYPE_CHECKING
 
 from wallet_bot.sheets import api
 from wallet_bot.config.settings import (
@@ -28,6 +30,11 @@ from wallet_bot.utils.timezone import (
     MANILA_TIMEZONE
 )
 
+# pandas is imported lazily inside the functions that need it, so webhook
+# verification and health checks never pay its import cost.
+if TYPE_CHECKING:
+    import pandas as pd
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
@@ -41,6 +48,95 @@ DATA_LOG_COLUMNS = [
     'user_id'
 ]
 
+# Per-thread write batch opened by batched_writes(): whether one is open and
+# whether a Formatted_Report regeneration was requested meanwhile
+_write_batch = threading.local()
+
+# Formatted_Report rebuilds run off the request path on a single background thread
+# (one at a time, since each clears and rewrites the whole sheet). While one is
+# queued but not yet started, further requests are folded into it.
+_regen_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sheets-regen')
+_regen_pending = False
+_regen_lock = threading.Lock()
+
+
+@contextmanager
+def batched_writes():
+    """
+    Group the Sheets writes made on this thread so follow-up work runs once on exit.
+    
+    Data_Log rows already go through the Sheets API write queue, which batches
+    them and retries failed writes. Inside the block, report regeneration is
+    deferred so it is scheduled once when the block exits. Nested blocks join
+    the outermost batch.
+    """
+    if getattr(_write_batch, 'active', False):
+        yield
+        return
+    
+    _write_batch.active = True
+    _write_batch.regenerate_report = False
+    try:
+        yield
+    finally:
+        regenerate_report = _write_batch.regenerate_report
+        _write_batch.active = False
+        _write_batch.regenerate_report = False
+        
+        if regenerate_report:
+            schedule_report_regeneration()
+
+
+def schedule_report_regeneration() -> None:
+    """
+    Rebuild the Formatted_Report sheet in the background without waiting for it.
+    
+    Inside batched_writes() the rebuild is deferred until the block exits.
+    Requests made while a rebuild is already queued are coalesced into that one.
+    """
+    global _regen_pending
+    
+    if getattr(_write_batch, 'active', False):
+        _write_batch.regenerate_report = True
+        return
+    
+    with _regen_lock:
+        if _regen_pending:
+            return
+        _regen_pending = True
+    
+    future = _regen_executor.submit(_run_scheduled_regeneration)
+    future.add_done_callback(_log_regeneration_failure)
+
+
+def _run_scheduled_regeneration() -> bool:
+    """Run a queued Formatted_Report rebuild, letting later requests queue a new one."""
+    global _regen_pending
+    
+    with _regen_lock:
+        _regen_pending = False
+    
+    return regenerate_formatted_report()
+
+
+def _log_regeneration_failure(future) -> None:
+    """Log a background Formatted_Report rebuild that raised."""
+    error = future.exception()
+    if error is not None:
+        logger.error(f"Background report regeneration failed: {str(error)}")
+
+
+def flush_pending_writes() -> None:
+    """
+    Write every row still queued by the Sheets background writer.
+    
+    Call this at shutdown, after the last transaction has been logged.
+    
+    Raises:
+        Exception: If any queued rows could not be written
+    """
+    api.flush_pending_rows(force=True)
+
 
 def log_transaction(transaction_type: str, category_or_source: str, 
                    description: str, amount: float, user_id: str) -> bool:
@@ -84,7 +180,7 @@ def log_transaction(transaction_type: str, category_or_source: str,
             user_id
         ]
         
-        # Append to Data_Log sheet
+        # Queued by the Sheets API and written in batches; failed writes are retried
         sheet_name = get_data_log_sheet_name()
         success = api.append_row(sheet_name, row_data)
         
@@ -98,20 +194,25 @@ def log_transaction(transaction_type: str, category_or_source: str,
         raise Exception(f"Failed to log transaction: {str(e)}")
 
 
-def get_transactions_for_period(period: str = "This Week", user_id: Optional[str] = None) -> List[Dict[str, Any]]:
+def get_transactions_for_period(period: str = "This Week", user_id: Optional[str] = None, columnar: bool = False) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
     """
     Retrieve transactions from Data_Log sheet for analysis.
     
     Args:
         period (str): "This Week" or "This Month"
         user_id (Optional[str]): Filter by specific user ID, None for all users
+        columnar (bool): Return a dict of columns instead of a list of rows,
+                         which the analytics generator can consume directly
         
     Returns:
-        List[Dict[str, Any]]: List of transaction dictionaries
+        Union[List[Dict[str, Any]], Dict[str, List[Any]]]: List of transaction
+        dictionaries, or a dict of column lists if columnar is True
         
     Raises:
         Exception: If reading operation fails
     """
+    import pandas as pd
+    
     try:
         sheet_name = get_data_log_sheet_name()
         
@@ -157,7 +258,7 @@ def get_transactions_for_period(period: str = "This Week", user_id: Optional[str
             # Debug: Show sample timestamps before conversion
             logger.info(f"DEBUG: Sample timestamps before conversion: {df['timestamp'].head().tolist()}")
             
-            df['timestamp'] = pd.to_datetime(df['timestamp'], format='%Y-%m-%d %H:%M:%S', errors='coerce')
+            df['timestamp'] = pd.to_datetime(df['timestamp'], format='%Y-%m-%d %H:%M:%S', errors='coerce', cache=True)
             
             # Check for any failed conversions
             failed_conversions = df['timestamp'].isna().sum()
@@ -181,10 +282,13 @@ def get_transactions_for_period(period: str = "This Week", user_id: Optional[str
         # Filter by period - FIXED: Better date calculation logic
         filtered_df = _filter_transactions_by_period_fixed(df, period)
         
-        # Convert back to list of dictionaries
-        transactions = filtered_df.to_dict('records')
+        # Convert back to list of dictionaries (or one list per column)
+        if columnar:
+            transactions = filtered_df.to_dict('list') if not filtered_df.empty else {}
+        else:
+            transactions = filtered_df.to_dict('records')
         
-        logger.info(f"Retrieved {len(transactions)} transactions for period '{period}'")
+        logger.info(f"Retrieved {len(filtered_df)} transactions for period '{period}'")
         return transactions
         
     except Exception as e:
@@ -194,7 +298,7 @@ def get_transactions_for_period(period: str = "This Week", user_id: Optional[str
 
 # In wallet_bot/sheets/handler.py
 
-def _filter_transactions_by_period_fixed(df: pd.DataFrame, period: str) -> pd.DataFrame:
+def _filter_transactions_by_period_fixed(df: 'pd.DataFrame', period: str) -> 'pd.DataFrame':
     """
     FIXED: Filter transactions DataFrame by the specified time period using Manila timezone.
     
@@ -205,6 +309,8 @@ def _filter_transactions_by_period_fixed(df: pd.DataFrame, period: str) -> pd.Da
     Returns:
         pd.DataFrame: Filtered DataFrame
     """
+    import pandas as pd
+    
     # Use Manila timezone for all date calculations
     now_manila_time = now_manila()
     
@@ -257,6 +363,8 @@ def debug_date_filtering(user_id: str):
     Debug function to help troubleshoot date filtering issues.
     Call this function manually to see what's happening.
     """
+    import pandas as pd
+    
     try:
         logger.info("=== DEBUG DATE FILTERING ===")
         
@@ -310,7 +418,7 @@ def debug_date_filtering(user_id: str):
     except Exception as e:
         logger.error(f"Debug function failed: {str(e)}")
 
-def _filter_transactions_by_period(df: pd.DataFrame, period: str) -> pd.DataFrame:
+def _filter_transactions_by_period(df: 'pd.DataFrame', period: str) -> 'pd.DataFrame':
     """
     Filter transactions DataFrame by the specified time period.
     
@@ -321,6 +429,8 @@ def _filter_transactions_by_period(df: pd.DataFrame, period: str) -> pd.DataFram
     Returns:
         pd.DataFrame: Filtered DataFrame
     """
+    import pandas as pd
+    
     now = datetime.now()
     
     if period == "This Week":
@@ -343,6 +453,21 @@ def _filter_transactions_by_period(df: pd.DataFrame, period: str) -> pd.DataFram
     return filtered_df
 
 
+def _to_float_series(amounts: 'pd.Series') -> 'pd.Series':
+    """
+    Convert an amount column to float64, coercing invalid values to NaN.
+    
+    Amounts read back from the sheet are normally already numeric, so try a
+    direct cast first and only fall back to the slower pd.to_numeric when it fails.
+    """
+    import pandas as pd
+    
+    try:
+        return amounts.astype('float64')
+    except (TypeError, ValueError):
+        return pd.to_numeric(amounts, errors='coerce')
+
+
 def regenerate_formatted_report() -> bool:
     """
     Regenerate the Formatted_Report sheet from Data_Log data.
@@ -357,6 +482,13 @@ def regenerate_formatted_report() -> bool:
     Raises:
         Exception: If regeneration operation fails
     """
+    # Inside batched_writes() this runs once, when the block exits
+    if getattr(_write_batch, 'active', False):
+        _write_batch.regenerate_report = True
+        return True
+    
+    import pandas as pd
+    
     try:
         data_sheet_name = get_data_log_sheet_name()
         report_sheet_name = get_formatted_report_sheet_name()
@@ -422,14 +554,15 @@ def regenerate_formatted_report() -> bool:
         
         # Convert data types
         try:
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
+            # An explicit format skips pandas' per-value format inference
+            df['timestamp'] = pd.to_datetime(df['timestamp'], format='%Y-%m-%d %H:%M:%S', cache=True)
         except Exception as e:
             logger.error(f"Error converting timestamp: {str(e)}")
             logger.error(f"Sample timestamp values: {df['timestamp'].head().tolist()}")
             return _create_empty_report(report_sheet_name)
         
         try:
-            df['amount'] = pd.to_numeric(df['amount'], errors='coerce')
+            df['amount'] = _to_float_series(df['amount'])
             # Remove rows with invalid amounts
             invalid_amounts = df['amount'].isna().sum()
             if invalid_amounts > 0:
@@ -533,10 +666,9 @@ def diagnose_sheet_structure() -> Dict[str, Any]:
     try:
         data_sheet_name = get_data_log_sheet_name()
         
-        # Get raw values
+        # Get raw values, then records; the records are built from the values
+        # just cached, so the sheet is only read once
         all_values = api.get_all_values(data_sheet_name)
-        
-        # Get records
         all_records = api.get_all_records(data_sheet_name)
         
         diagnosis = {
@@ -558,7 +690,7 @@ def diagnose_sheet_structure() -> Dict[str, Any]:
         return {'error': str(e)}
     
 
-def _build_formatted_report_content(df: pd.DataFrame) -> List[List[str]]:
+def _build_formatted_report_content(df: 'pd.DataFrame') -> List[List[str]]:
     """
     Build the content for the formatted report with daily grouping.
     
@@ -869,6 +1001,8 @@ def debug_amount_conversion(user_id: str):
     """
     Debug function to troubleshoot amount conversion issues.
     """
+    import pandas as pd
+    
     try:
         logger.info("=== DEBUGGING AMOUNT CONVERSION ===")
         
@@ -937,6 +1071,8 @@ def analyze_financial_data(transactions: List[Dict[str, Any]]) -> Dict[str, Any]
     Returns:
         Dict[str, Any]: Analysis results with financial metrics
     """
+    import pandas as pd
+    
     try:
         if not transactions:
             logger.info("No transactions to analyze")
@@ -976,8 +1112,11 @@ def analyze_financial_data(transactions: List[Dict[str, Any]]) -> Dict[str, Any]
                     return 0.0
             return 0.0
         
-        # Apply the conversion function
-        df['amount_numeric'] = df['amount'].apply(convert_amount)
+        # Apply the conversion function, using a vectorized cast when every amount is already numeric
+        try:
+            df['amount_numeric'] = df['amount'].astype('float64')
+        except (TypeError, ValueError):
+            df['amount_numeric'] = df['amount'].apply(convert_amount)
         
         # Debug: Check conversion results
         logger.info(f"Converted amounts: {df['amount_numeric'].tolist()}")
@@ -9,3 +9,10 @@ from .timezone import (
     parse_manila_timestamp,
     MANILA_TIMEZONE
 )
+
+from .http import (
+    get_http_session,
+    mount_pooled_adapter
+)
+
+from .cache import TTLCache
@@ -0,0 +1,72 @@
+# wallet_bot/utils/cache.py
+"""
+Small in-process caching utilities.
+
+Provides a thread-safe, size-bounded cache whose entries expire after a fixed
+time-to-live, for values that are expensive to fetch (e.g. Google Sheets reads)
+but fine to serve slightly stale.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire ttl seconds after being set.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Args:
+            maxsize (int): Maximum number of entries; the least recently used is evicted first
+            ttl (float): Seconds an entry stays valid after it is set
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value if it is present and hasn't expired.
+
+        Returns:
+            The cached value, or default on a miss
+        """
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return default
+
+            expires_at, value = item
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return default
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove a key and return its value (expired or not), or default if absent."""
+        with self._lock:
+            item = self._entries.pop(key, None)
+            return default if item is None else item[1]
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
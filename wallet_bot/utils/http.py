@@ -0,0 +1,74 @@
+# wallet_bot/utils/http.py
+"""
+Shared HTTP session utilities.
+
+Outbound calls to the Meta Graph API and Google Sheets reuse pooled keep-alive
+connections instead of paying a fresh TCP + TLS handshake on every request.
+"""
+
+import threading
+from typing import Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Connection pool sizing for each mounted adapter
+POOL_CONNECTIONS = 20
+POOL_MAXSIZE = 50
+
+# Responses worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def mount_pooled_adapter(
+    session: requests.Session,
+    pool_maxsize: int = POOL_MAXSIZE,
+    retry_statuses: Tuple[int, ...] = RETRY_STATUSES
+) -> requests.Session:
+    """
+    Mount a pooled, retrying HTTPS adapter on a session.
+    
+    Only idempotent requests (GET, PUT, DELETE, ...) are retried, so a flaky
+    connection never sends the same message or appends the same row twice.
+    Rate-limited (429) responses are retried too, waiting as long as the
+    server's Retry-After header asks, unless 429 is left out of retry_statuses.
+    
+    Args:
+        session (requests.Session): Session to configure
+        pool_maxsize (int): Most connections kept open per host
+        retry_statuses (Tuple[int, ...]): Response statuses to retry
+        
+    Returns:
+        requests.Session: The same session, for chaining
+    """
+    retries = Retry(total=3, backoff_factor=0.2, status_forcelist=retry_statuses)
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=pool_maxsize,
+        max_retries=retries
+    )
+    session.mount('https://', adapter)
+    return session
+
+
+def get_http_session() -> requests.Session:
+    """
+    Get the process-wide HTTP session, creating it on first use.
+    
+    Returns:
+        requests.Session: Shared session with a pooled HTTPS adapter
+    """
+    global _session
+    
+    if _session is not None:
+        return _session
+    
+    with _session_lock:
+        if _session is None:
+            _session = mount_pooled_adapter(requests.Session())
+        return _session